@@ -1,3 +1,5 @@
+import sys
+import importlib
 import typer
 
 from settings import (
@@ -5,31 +7,70 @@ from settings import (
     DEFAULT_CLI_NAME,
 )
 
-from cli.commands.backup import backup_app
-from cli.commands.secrets import secrets_app
-from cli.commands.sheets import sheets_app
-from cli.console_ui import banners
+# Sub-apps are registered lazily: only the module of the invoked subcommand
+# is imported, the rest get a help-only placeholder so the top-level help
+# can still list them. name → (module, attribute, help)
+SUB_APPS: dict[str, tuple[str, str, str]] = {
+    "backup": ("cli.commands.backup", "backup_app", "Backup related operations"),
+    "secrets": ("cli.commands.secrets", "secrets_app", "Secrets related operations"),
+    "sheets": ("cli.commands.sheets", "sheets_app", "Excel sheet related operations"),
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the first non-option argument (the invoked subcommand), if any."""
+    for arg in argv[1:]:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _register_sub_apps(app: typer.Typer, invoked: str | None) -> None:
+    for name, (module_path, attr, help_text) in SUB_APPS.items():
+        if name == invoked:
+            sub_app = getattr(importlib.import_module(module_path), attr)
+        else:
+            sub_app = typer.Typer()
+        app.add_typer(sub_app, name=name, help=help_text)
+
 
 app = typer.Typer(
     name= f"{DEFAULT_CLI_NAME}",
     help= f"{DEFAULT_CLI_NAME} — Automates generating, retrieving, and archiving Nozomi Guardian backups across the selected stations.",
 )
 
-app.add_typer(backup_app, name="backup", help="Backup related operations")
-app.add_typer(secrets_app, name="secrets", help="Secrets related operations")
-app.add_typer(sheets_app, name="sheets", help="Excel sheet related operations")
+_register_sub_apps(app, _sniff_subcommand(sys.argv))
 
 
 @app.command("about", help="Show program information and company logo")
 def about() -> None:
+    from cli.console_ui import banners
+
     banners.display_general_info_banner()
 
 
 @app.callback(invoke_without_command=True)
-def global_options(ctx: typer.Context, version: bool = False):
+def global_options(
+        ctx: typer.Context,
+        version: bool = False,
+        no_banner: bool = typer.Option(
+            False,
+            "--no-banner",
+            help="Do not print the welcome banner (also skipped when stdout is not a terminal).",
+        ),
+        skip_integrity_checks: bool = typer.Option(
+            False,
+            "--skip-integrity-checks",
+            help="Trust the stations data files and Excel file without verifying their checksums.",
+        ),
+    ):
+    ctx.ensure_object(dict).update(
+        no_banner= no_banner,
+        skip_integrity_checks= skip_integrity_checks,
+    )
     if version:
         typer.echo(f"{DEFAULT_CLI_NAME} version {VERSION}")
         raise typer.Exit()
     if ctx.invoked_subcommand is None:
         # If they ran just `mycli` with no command, print the top-level help
-        typer.echo(ctx.get_help())
\ No newline at end of file
+        typer.echo(ctx.get_help())
@@ -1,19 +1,23 @@
+from __future__ import annotations
+
 import typer
-from pydantic import ValidationError
+from typing import TYPE_CHECKING
 
-from features.stations.repository import StationDataRepository
-from features.stations.secrets_handler import StationSecretsHandler
-from features.backups.runner import BackupsRunner
-from features.backups.failures_store import FailuresStore, BackupFailureRecord
+from settings import MAX_PARALLEL_BACKUPS, MAX_PARALLEL_BACKUPS_LIMIT, SSH_KEEPALIVE_INTERVAL
 
+from cli import deps
 from cli.console_ui import (
     banners,
-    checksum_validation,
-    menus,
-    secrets_ui,
     usage_hints,
 )
-from cli.console_ui.progress_ui.backup_progress import BackupsProgress
+
+# features.* (and the console_ui modules built on them) pull in pydantic,
+# cryptography, paramiko and rich; they are imported inside the commands so
+# `backup --help` does not pay for them.
+if TYPE_CHECKING:
+    from features.stations.secrets_handler import StationSecretsHandler
+    from features.backups.failures_store import FailuresStore
+    from ssh.pool import SSHConnectionPool
 
 
 backup_app = typer.Typer()
@@ -54,10 +58,31 @@ def backup_run(
         "-m",
         help="External IP(s) of machine(s) to back up; if omitted you will be prompted (unless -y is set)",
     ),
+    serial: bool = typer.Option(
+        False,
+        "--serial",
+        help="Back up one machine at a time instead of in parallel (always the case with --verbose).",
+    ),
+    max_parallel: int = typer.Option(
+        MAX_PARALLEL_BACKUPS,
+        "--max-parallel",
+        min=1,
+        max=MAX_PARALLEL_BACKUPS_LIMIT,
+        help="Maximum number of machines of a station backed up at the same time "
+             f"(default: {MAX_PARALLEL_BACKUPS}, MAX_PARALLEL_BACKUPS in the .env file; "
+             f"at most {MAX_PARALLEL_BACKUPS_LIMIT}, the CMC sshd MaxSessions minus the parallel copies).",
+        show_default=False,
+    ),
 ) -> None:
     """
     Run the backup process for all configured targets.
     """
+    from pydantic import ValidationError
+    from features.stations.secrets_handler import StationSecretsHandler
+    from features.backups.failures_store import FailuresStore
+    from ssh.pool import SSHConnectionPool
+    from cli.console_ui import checksum_validation, menus, secrets_ui
+
     banners.welcome_banner()
     
     key = secrets_ui.prompt_and_validate_fernet_key()
@@ -74,7 +99,7 @@ def backup_run(
     station_secrets_handler = StationSecretsHandler(key= key)
 
     try:
-        stations_repo = StationDataRepository()
+        stations_repo = deps.get_stations_repo()
     except FileNotFoundError as e:
         typer.echo(f"ERROR: {e}", err=True)
         usage_hints.hint_load_data_from_excel()
@@ -88,24 +113,32 @@ def backup_run(
         stations_data_repo= stations_repo,
     )
 
-    for _, station_name in selected_stations:
-        station_data = stations_repo.get_station_data(station_name= station_name)
-        
-        _run_station_backup(
-            station_name= station_name,
-            station_data= station_data,
-            station_secrets_handler = station_secrets_handler,
-            stations_repo = stations_repo,
-            fails_store = fails_store,
-            machines = machines,
-            yes_all = yes_all,
-            backup_all_confirmation_prompt_msg = f"Back up ALL Guardian machines in {station_name}?",
-            section_title = "Backups",
-            backup_script_timeout = backup_script_timeout,
-            connection_timeout = connection_timeout,
-            shell_prompt_timeout = shell_prompt_timeout,
-            verbose = verbose,
-        )
+    # read all the selected stations' data and secrets files up front, in one batch
+    selected_station_names = [station_name for _, station_name in selected_stations]
+    stations_repo.load_all_stations_data(selected_station_names)
+    station_secrets_handler.preload_all(selected_station_names)
+
+    with SSHConnectionPool(keepalive_interval= SSH_KEEPALIVE_INTERVAL) as connection_pool:
+        for _, station_name in selected_stations:
+            station_data = stations_repo.get_station_data(station_name= station_name)
+            
+            _run_station_backup(
+                station_name= station_name,
+                station_data= station_data,
+                station_secrets_handler = station_secrets_handler,
+                fails_store = fails_store,
+                connection_pool = connection_pool,
+                machines = machines,
+                yes_all = yes_all,
+                backup_all_confirmation_prompt_msg = f"Back up ALL Guardian machines in {station_name}?",
+                section_title = "Backups",
+                backup_script_timeout = backup_script_timeout,
+                connection_timeout = connection_timeout,
+                shell_prompt_timeout = shell_prompt_timeout,
+                verbose = verbose,
+                serial = serial,
+                max_parallel = max_parallel,
+            )
         
 
 @backup_app.command("retry-failures")
@@ -143,10 +176,31 @@ def backup_retry_failures(
         "-m",
         help="External IP(s) of machine(s) to back up; if omitted you will be prompted (unless -y is set)",
     ),
+    serial: bool = typer.Option(
+        False,
+        "--serial",
+        help="Back up one machine at a time instead of in parallel (always the case with --verbose).",
+    ),
+    max_parallel: int = typer.Option(
+        MAX_PARALLEL_BACKUPS,
+        "--max-parallel",
+        min=1,
+        max=MAX_PARALLEL_BACKUPS_LIMIT,
+        help="Maximum number of machines of a station backed up at the same time "
+             f"(default: {MAX_PARALLEL_BACKUPS}, MAX_PARALLEL_BACKUPS in the .env file; "
+             f"at most {MAX_PARALLEL_BACKUPS_LIMIT}, the CMC sshd MaxSessions minus the parallel copies).",
+        show_default=False,
+    ),
 ) -> None:
     """
     Re-run backups **only** for machines that failed in the last run.
     """
+    from pydantic import ValidationError
+    from features.stations.secrets_handler import StationSecretsHandler
+    from features.backups.failures_store import FailuresStore
+    from ssh.pool import SSHConnectionPool
+    from cli.console_ui import checksum_validation, menus, secrets_ui
+
     banners.welcome_banner()
 
     fails_store = FailuresStore()
@@ -169,7 +223,7 @@ def backup_retry_failures(
     station_secrets_handler = StationSecretsHandler(key= key)
 
     try:
-        stations_repo = StationDataRepository()
+        stations_repo = deps.get_stations_repo()
     except FileNotFoundError as e:
         typer.echo(f"ERROR: {e}", err=True)
         usage_hints.hint_load_data_from_excel()
@@ -177,37 +231,41 @@ def backup_retry_failures(
 
     checksum_validation.stations_json_data_files_integrity_check(stations_repo= stations_repo)
     checksum_validation.xls_data_file_integrity_check()
+
+    # decrypt the selected stations' secrets up front, in one batch
+    station_secrets_handler.preload_all([station_name for _, station_name in selected_stations])
     
-    for _, station_name in selected_stations:
-        # build index of GUARDIANs by external IP
-        ext_ip_index = stations_repo.build_station_index(
-            station_name, by="ip_external", skip_missing=True
-        )
-        station_data = []      
-        failed_ips = [str(d.ip) for d in fails_store.data.stations[station_name].failures]
-
-        for m_ip, m_data in ext_ip_index.items():
-            if m_data["type"] == "CMC":
-                station_data.append(m_data)
-                continue
-            if m_ip in failed_ips:
-                station_data.append(m_data)
-
-        _run_station_backup(
-            station_name= station_name,
-            station_data= station_data,
-            station_secrets_handler = station_secrets_handler,
-            stations_repo = stations_repo,
-            fails_store = fails_store,
-            machines = machines,
-            yes_all = yes_all,
-            backup_all_confirmation_prompt_msg = "Re-try ALL backups for previously failed machines?",
-            section_title = "Backup retries",
-            backup_script_timeout = backup_script_timeout,
-            connection_timeout = connection_timeout,
-            shell_prompt_timeout = shell_prompt_timeout,
-            verbose = verbose,
-        )
+    with SSHConnectionPool(keepalive_interval= SSH_KEEPALIVE_INTERVAL) as connection_pool:
+        for _, station_name in selected_stations:
+            # build index of GUARDIANs by external IP
+            ext_ip_index = stations_repo.build_station_index(
+                station_name, by="ip_external", skip_missing=True
+            )
+            failed_ips = fails_store.get_failed_ip_set(station_name)
+            # keep the CMC (gateway) plus every machine that failed last time
+            station_data = [
+                m_data
+                for m_ip, m_data in ext_ip_index.items()
+                if m_data["type"] == "CMC" or m_ip in failed_ips
+            ]
+
+            _run_station_backup(
+                station_name= station_name,
+                station_data= station_data,
+                station_secrets_handler = station_secrets_handler,
+                fails_store = fails_store,
+                connection_pool = connection_pool,
+                machines = machines,
+                yes_all = yes_all,
+                backup_all_confirmation_prompt_msg = "Re-try ALL backups for previously failed machines?",
+                section_title = "Backup retries",
+                backup_script_timeout = backup_script_timeout,
+                connection_timeout = connection_timeout,
+                shell_prompt_timeout = shell_prompt_timeout,
+                verbose = verbose,
+                serial = serial,
+                max_parallel = max_parallel,
+            )
 
 
 def _prepare_station_data_for_runner(
@@ -215,32 +273,42 @@ def _prepare_station_data_for_runner(
         station_name: str,
         machines: list[str] | None,
         yes_all: bool,
-        stations_repo: StationDataRepository,
         confrimation_prmpt: str = "Backup all machines?",
     ) -> list[dict]:
     """
-    Given full station_data and optional --machine flags or --yes,
-    return the exact list to feed into BackupsRunner:
+    Given station_data and optional --machine flags or --yes,
+    return the exact list to feed into BackupsRunner (only machines
+    present in station_data can be selected):
       - --yes:           station_data unchanged (CMC + all guardians)
       - flags:           [CMC] + only those IPs
       - menu-subset:     [CMC] + the user-picked subset
     """
+    from cli.console_ui import menus
+
     # If they passed -y/--yes, skip everything and back up all machines:
     if yes_all:
         return station_data
     
-    # isolate the single CMC
-    try:
-        cmc = next(m for m in station_data if m["type"] == "CMC")
-    except StopIteration:
+    # single pass: the CMC and an index of the machines by external IP
+    cmc: dict | None = None
+    ext_ip_index: dict[str, dict] = {}
+    for m in station_data:
+        if m["type"] == "CMC" and cmc is None:
+            cmc = m
+        ip = m.get("ip_external")
+        if ip is None:
+            continue
+        if ip in ext_ip_index:
+            # same guard as `StationDataRepository.build_station_index`
+            raise ValueError(
+                f"Duplicate value '{ip}' for key 'ip_external' in '{station_name}' data"
+            )
+        ext_ip_index[ip] = m
+
+    if cmc is None:
         typer.echo(f"ERROR: no CMC entry in data for station {station_name}", err=True)
         raise typer.Exit(1)
 
-    # build index of GUARDIANs by external IP
-    ext_ip_index = stations_repo.build_station_index(
-        station_name, by="ip_external", skip_missing=True
-    )
-
     # cli flag-based selection
     if machines: 
         try:
@@ -277,8 +345,8 @@ def _run_station_backup(
         station_name: str,
         station_data: list[dict],
         station_secrets_handler: StationSecretsHandler,
-        stations_repo: StationDataRepository,
         fails_store: FailuresStore,
+        connection_pool: SSHConnectionPool,
         machines: list[str] | None,
         yes_all: bool,
         backup_all_confirmation_prompt_msg: str,
@@ -287,8 +355,15 @@ def _run_station_backup(
         connection_timeout: int,
         shell_prompt_timeout: int,
         verbose: bool,
+        serial: bool = False,
+        max_parallel: int = MAX_PARALLEL_BACKUPS,
     ) -> None:
     """Common code used by both *run* and *retry-failures* commands."""
+    from features.backups.runner import BackupsRunner
+    from features.backups.failures_store import BackupFailureRecord
+    from cli.console_ui import secrets_ui
+    from cli.console_ui.progress_ui.backup_progress import BackupsProgress
+
     station_secrets = secrets_ui.load_station_secrets_or_exit(
         secrets_handler= station_secrets_handler,
         station_name= station_name
@@ -299,7 +374,6 @@ def _run_station_backup(
         station_name=station_name,
         machines=machines,
         yes_all=yes_all,
-        stations_repo=stations_repo,
         confrimation_prmpt= backup_all_confirmation_prompt_msg,
     )
 
@@ -315,6 +389,8 @@ def _run_station_backup(
         connection_timeout= connection_timeout,
         shell_prompt_timeout= shell_prompt_timeout,
         verbose= verbose,
+        connection_pool= connection_pool,
+        max_workers= 1 if serial else max_parallel,
     )
 
     summary = BackupsProgress(runner, station_name, verbose).run()
@@ -325,7 +401,7 @@ def _run_station_backup(
     for m_name, ext_ip, err_msg in summary.failures:
         fails_store.add_failure(
             station_name,
-            BackupFailureRecord(machine=m_name, ip=ext_ip, error=err_msg),  # type: ignore[arg-type]
+            BackupFailureRecord(machine=m_name, ip=ext_ip, error=err_msg),
         )
 
     fails_store.save()
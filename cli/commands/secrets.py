@@ -1,23 +1,20 @@
 import typer
-from pydantic import ValidationError
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from settings import (
     DEBUG,
 )
 
-from features.stations.repository import StationDataRepository
-from features.stations.secrets_handler import StationSecretsHandler
-from features.ops import secrets_ops
-
+from cli import deps
 from cli.console_ui import (
     banners,
-    menus,
-    checksum_validation,
-    secrets_ui,
     usage_hints,
 )
 
+# features.* (and the console_ui modules built on them) pull in pydantic and
+# cryptography; they are imported inside the commands that need them.
+
 secrets_app = typer.Typer()
 
 
@@ -39,10 +36,13 @@ def generate_templates():
     """
     Create a new secrets template file.
     """
+    from features.ops import secrets_ops
+    from cli.console_ui import checksum_validation, menus
+
     banners.welcome_banner()
     
     try:
-        stations_repo = StationDataRepository()
+        stations_repo = deps.get_stations_repo()
     except FileNotFoundError as e:
         typer.echo(f"ERROR: {e}", err=True)
         usage_hints.hint_load_data_from_excel()
@@ -73,6 +73,10 @@ def encrypt_templates() -> None:
     into
       data/stations_secrets/encrypted/
     """
+    from pydantic import ValidationError
+    from features.stations.secrets_handler import StationSecretsHandler
+    from cli.console_ui import menus, secrets_ui
+
     banners.welcome_banner()
     
     key = secrets_ui.prompt_and_validate_fernet_key()
@@ -87,20 +91,37 @@ def encrypt_templates() -> None:
 
     typer.confirm("Are you sure you want to encrypt the selected templates?", abort=True)
 
-    for f in template_files:
-        try:
-            secrets_handler.validate_template_file(filepath= f)
-        except ValidationError as e:
-            typer.echo()
-            typer.echo(f"Template {f} validation error", err=True)
-            typer.echo(e, err=True)
-            raise typer.Exit(1)
+    # every template is cross-checked against the same stations data
+    try:
+        stations_repo = deps.get_stations_repo()
+    except FileNotFoundError as e:
+        typer.echo(f"ERROR: {e}", err=True)
+        usage_hints.hint_load_data_from_excel()
+        raise typer.Exit(1)
+
+    # templates are independent, validate them concurrently. Every template
+    # is read only once, the validated data is what gets encrypted below.
+    templates_data: dict[str, dict] = {}
+    with ThreadPoolExecutor() as executor:
+        futures = {
+            executor.submit(secrets_handler.validate_template_file, filepath= f, stations_repo= stations_repo): f
+            for f in template_files
+        }
+        for future in as_completed(futures):
+            try:
+                templates_data[futures[future]] = future.result()
+            except ValidationError as e:
+                for pending in futures:
+                    pending.cancel()
+                typer.echo()
+                typer.echo(f"Template {futures[future]} validation error", err=True)
+                typer.echo(e, err=True)
+                raise typer.Exit(1)
             
     
-    # we alredy validated the files content in the previous for loop
-    encrypted_files = secrets_handler.encrypt_multiple_secrets_templates(
-        template_files= template_files,
-        validate= False
+    # nothing is encrypted unless every selected template is valid
+    encrypted_files = secrets_handler.encrypt_multiple_secrets_templates_data(
+        [templates_data[f] for f in template_files]
     )
 
     typer.echo("Generated files:")
@@ -1,19 +1,25 @@
+import sys
 import typer
+from functools import lru_cache
 from pathlib import Path
-import pyfiglet
-
-from rich import box
-from rich.console import Console, Group
-from rich.columns import Columns
-from rich.table import Table
-from rich.text import Text
-from rich.align import Align
-from rich.panel import Panel
 
 from settings import VERSION, DEFAULT_CLI_NAME
+from cli.global_options import get_global_option
+
+
+@lru_cache(maxsize=None)
+def _load_ascii_art(filename: str) -> str:
+    """Read an ascii_art/ file from disk (once per process)."""
+    # adjust this path if you rename 'static' → 'ascii_art' or similar
+    art_path = Path(__file__).parent
+    art_path = art_path.joinpath("ascii_art", filename)
+    return art_path.read_text(encoding="utf-8")
 
 
 def welcome_banner() -> None:
+    if get_global_option("no_banner") or not sys.stdout.isatty():
+        return
+
     welcome = f"***** WELCOME TO {DEFAULT_CLI_NAME.upper()}!!! *****"
     typer.echo(welcome)
     typer.echo("Nozomi Automated Recursive Backups And Load-down")
@@ -25,15 +31,31 @@ def display_general_info_banner() -> None:
     Load your ANSI-colored logo from disk and render it
     side-by-side with porgram info.
     """
-    console = Console()
+    from rich.console import Console
 
-    # adjust this path if you rename 'static' → 'ascii_art' or similar
-    logo_path = Path(__file__).parent 
-    logo_path = logo_path.joinpath("ascii_art", "telefonica_logo.txt")
-    logo = logo_path.read_text(encoding="utf-8")
+    Console().print(_build_general_info_renderable())
+
+
+@lru_cache(maxsize=1)
+def _build_general_info_renderable():
+    """
+    Build (once per process) the static logo + program info layout shown by
+    `display_general_info_banner`.
+    """
+    # rich is only needed here, keep it out of the startup path
+    from rich import box
+    from rich.console import Group
+    from rich.columns import Columns
+    from rich.table import Table
+    from rich.text import Text
+    from rich.align import Align
+    from rich.panel import Panel
+
+    logo = _load_ascii_art("telefonica_logo.txt")
 
     program_name_tittle = Align.center(
-        Text.from_ansi(pyfiglet.figlet_format("Narbal", font="standard")),
+        # pre-rendered with pyfiglet.figlet_format("Narbal", font="standard")
+        Text.from_ansi(_load_ascii_art("narbal_title.txt")),
         # vertical="top",
     )
 
@@ -76,16 +98,14 @@ def display_general_info_banner() -> None:
 
     right_column = Group(program_name_tittle, name_acronim, info_panel)
 
-    # print them side by side
-    console.print(
-        Columns(
-            [
-                Text.from_ansi(logo),
-                right_column
-                # Align(info_panel, align="left", vertical="middle"),
-            ],
-            expand=False
-        )
+    # place them side by side
+    return Columns(
+        [
+            Text.from_ansi(logo),
+            right_column
+            # Align(info_panel, align="left", vertical="middle"),
+        ],
+        expand=False
     )
 
 
@@ -8,6 +8,7 @@ from exceptions import ChecksumVerificationError
 from features.stations.repository import StationDataRepository
 from features.ops import checksums_ops
 
+from cli.global_options import get_global_option
 from cli.console_ui import usage_hints
 
 
@@ -15,6 +16,9 @@ def stations_json_data_files_integrity_check(stations_repo: StationDataRepositor
     """
     Run the JSON-data integrity check or exit with an error message.
     """
+    if get_global_option("skip_integrity_checks"):
+        return
+
     typer.echo("🔍 Performing station data files integrity check…")
     try:
         checksums_ops.verify_station_json_data_files_checksums(
@@ -31,6 +35,9 @@ def xls_data_file_integrity_check() -> None:
     """
     Verify the XLS checksum or exit with instructions if it fails or is missing.
     """
+    if get_global_option("skip_integrity_checks"):
+        return
+
     typer.echo(f"🔍 Verifying checksum for: {STATION_MACHINES_DATA_SHEET}")
     try:
         match = checksums_ops.verify_xls_checksum()
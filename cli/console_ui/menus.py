@@ -1,9 +1,9 @@
 import typer
 from features.stations.repository import StationDataRepository
-from features.stations.secrets_handler import StationSecretsHandler
 from features.stations.exceptions import CorruptedDataFileError
 from features.backups.failures_store import FailuresStore
 
+from cli import deps
 from cli.console_ui import (
     usage_hints,
     parsers,
@@ -14,9 +14,10 @@ def display_list(items: list[str], header: str = "Available items:") -> None:
         """
         Prints a numbered list with an optional header.
         """
-        typer.echo(header)
-        for i, name in enumerate(items, start=1):
-            typer.echo(f"  {i}. {name}")
+        # a single write instead of one echo (write + flush) per item
+        lines = [header]
+        lines.extend(f"  {i}. {name}" for i, name in enumerate(items, start=1))
+        typer.echo("\n".join(lines))
 
 def prompt_list_selection(
     items: list[str],
@@ -25,19 +26,16 @@ def prompt_list_selection(
 ) -> list[tuple[int, str]]:
     """
         Displays numbered `items`, asks for a selection string, and returns
-        the chosen items (1-based indices).
+        the chosen items (1-based indices) in the order they were selected.
     """
     display_list(items= items, header= header)
-    sel = input(f"{prompt}").strip()
+    sel = typer.prompt(prompt, default="", show_default=False, prompt_suffix="").strip()
 
-    try:
-        nums = parsers.parse_number_selection(sel)
-    except ValueError as e:
-        raise e
+    nums = parsers.parse_number_selection(sel)
     
-    # filter out-of-range and convert to zero-based
+    # filter out-of-range and convert to zero-based, keeping the user's order
     chosen: list[tuple[int, str]] = []
-    for n in sorted(nums):
+    for n in nums:
         if 1 <= n <= len(items):
             chosen.append((n, items[n-1]))
         else:
@@ -71,7 +69,7 @@ def display_avalible_secrets_templates_menu(
         prompt: str = "Select station tamplates by numbers (e.g. 1,3-5): "
     ) -> list[tuple[int, str]]:
    
-    template_files = StationSecretsHandler.get_template_paths()
+    template_files = deps.get_template_paths()
     if not template_files:
         typer.secho("⚠️ No secrets templates found")
         usage_hints.hint_generate_secret_templates()
@@ -96,21 +94,19 @@ def display_available_machines_menu(
     prompt for a numbered selection, and return a list of
     (1-based index, display_label, ip_external) tuples.
     """
-    # Build the list of IPs we care about:
-    machines_data = [
-        (m["machine_name"], m["ip_external"])
-        for m in station_data
-        if m.get("type") == "GUARDIAN" and m.get("state") != "pendiente"
-    ]
+    # Build, in one pass, the (name, ip) pairs we care about and their menu labels
+    machines_data: list[tuple[str, str]] = []
+    items: list[str] = []
+    for m in station_data:
+        if m.get("type") == "GUARDIAN" and m.get("state") != "pendiente":
+            name, ip = m["machine_name"], m["ip_external"]
+            machines_data.append((name, ip))
+            items.append(f"{name} ({ip})")
+
     if not machines_data:
         typer.secho("⚠️ No eligible machines found in this station", err=True)
         raise typer.Exit(1)
 
-    items = [
-        f"{m[0]} ({m[1]})"
-        for m in machines_data
-    ]
-
     # Prompt for selection:
     try:
         selections = prompt_list_selection(
@@ -122,12 +118,7 @@ def display_available_machines_menu(
         typer.echo(f"ERROR: {e}", err=True)
         raise typer.Exit(1)
     
-    result = []
-    for idx, _ in selections:
-        name, ip = machines_data[idx - 1]
-        result.append((idx, name, ip))
-
-    return result
+    return [(idx, *machines_data[idx - 1]) for idx, _ in selections]
 
 
 def display_stations_with_failed_backups_menu(
@@ -148,9 +139,7 @@ def display_stations_with_failed_backups_menu(
           warning and lets the caller decide how to proceed).
     """
     # pick stations that actually have failures
-    candidate_stations = [
-        st for st, data in fails_store.data.stations.items() if data.failures
-    ]
+    candidate_stations = fails_store.get_stations_with_failures()
 
     if not candidate_stations:
         typer.echo("⚠️  No stations have stored failures", err=True)
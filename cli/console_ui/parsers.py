@@ -1,33 +1,51 @@
+import re
 
+# "<n>" or "<start>-<end>", surrounding whitespace allowed
+_SELECTION_TOKEN_REGEX = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+)\s*)?")
 
-def parse_number_selection(selection: str) -> set[int]:
+
+def parse_number_selection(selection: str) -> list[int]:
         """
-        Parse a comma-and-dash separated selection string into a set of ints.
+        Parse a comma-and-dash separated selection string into a list of ints,
+        in the order they were written and without duplicates.
 
         Supports formats like:
-        - "3"      → {3}
-        - "1,4,6"  → {1,4,6}
-        - "2-5"    → {2,3,4,5}
-        - "1,3-5"  → {1,3,4,5}
+        - "3"      → [3]
+        - "1,4,6"  → [1,4,6]
+        - "2-5"    → [2,3,4,5]
+        - "5,1-3"  → [5,1,2,3]
+
+        Empty entries are ignored.
 
-        Ignores invalid entries.
+        Raises:
+            ValueError: If an entry is not a number or a valid ascending range.
         """
-        out = set()
-        for part in filter(None, (p.strip() for p in selection.split(","))):
-            if "-" in part:
-                try:
-                    a, b = part.split("-", 1)
-                    start, end = int(a), int(b)
-                    if start >= end:                   
-                        raise ValueError(
-                            f"Invalid range format {start}-{end}, the second element must be greater than the first one."
-                        )
-                except ValueError as e:
-                    raise e
-                out.update(range(start, end + 1))
+        out: list[int] = []
+        seen: set[int] = set()
+        fullmatch = _SELECTION_TOKEN_REGEX.fullmatch
+
+        for part in selection.split(","):
+            if not part.strip():
+                continue
+
+            match = fullmatch(part)
+            if match is None:
+                raise ValueError(f"Invalid selection entry '{part.strip()}'")
+
+            start, end = match.groups()
+            if end is None:
+                numbers = (int(start),)
             else:
-                try:
-                    out.add(int(part))
-                except ValueError as e:
-                    raise e
-        return out
\ No newline at end of file
+                start, end = int(start), int(end)
+                if start >= end:
+                    raise ValueError(
+                        f"Invalid range format {start}-{end}, the second element must be greater than the first one."
+                    )
+                numbers = range(start, end + 1)
+
+            for n in numbers:
+                if n not in seen:
+                    seen.add(n)
+                    out.append(n)
+
+        return out
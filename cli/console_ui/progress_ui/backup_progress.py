@@ -1,6 +1,9 @@
-import os
+import queue
+import threading
 import typer
-from typing import NamedTuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Generator, NamedTuple
 from rich.progress import (
     Progress,
     TextColumn,
@@ -10,6 +13,7 @@ from rich.progress import (
 
 from settings import (
     BACKUPS_DESTINATION_DIRECTORY,
+    MAX_PARALLEL_COPIES,
 )
 from features.backups.runner import BackupResult, BackupsRunner
 from features.stations.exceptions import MachinePasswordMissingError
@@ -22,20 +26,90 @@ class BackupSummary(NamedTuple):
     failures:  list[tuple[str, str, str]]
 
 
+# marks the end of the backup results queue
+_END_OF_RESULTS = object()
+# seconds a blocked producer waits between checks of the stop event
+_PUT_POLL_INTERVAL = 0.2
+
+
+def _put_unless_stopped(results: queue.Queue, item: object, stop: threading.Event) -> bool:
+    """
+    Put *item* in the bounded *results* queue, giving up once *stop* is set
+    (the consumer is gone and will never make room). Returns True if put.
+    """
+    while not stop.is_set():
+        try:
+            results.put(item, timeout= _PUT_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+
+    return False
+
+
+class _RichProgress(Progress):
+    """Live per-machine progress table."""
+
+    def task_fields(self, task_id: TaskID) -> dict:
+        with self._lock:
+            return self._tasks[task_id].fields
+
+
+class _PlainProgress:
+    """
+    Stand-in for `_RichProgress` in verbose runs, where the remote output is
+    streamed to the terminal: nothing is rendered, finished machines are
+    reported with a plain line.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: list[dict] = []    # [{description, **fields}], index = task id
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def add_task(self, description: str, total: float | None = None, **fields) -> TaskID:
+        self._tasks.append({"description": description, **fields})
+        return TaskID(len(self._tasks) - 1)
+
+    def update(self, task_id: TaskID, description: str | None = None, **fields) -> None:
+        if description is not None:
+            self._tasks[task_id]["description"] = description
+
+    def stop_task(self, task_id: TaskID) -> None:
+        t = self._tasks[task_id]
+        typer.echo(f"{t['num_position']}. {t['machine_name']}({t['machine_ext_ip']}): {t['description']}")
+
+    def stop(self) -> None:
+        pass
+
+    def task_fields(self, task_id: TaskID) -> dict:
+        return self._tasks[task_id]
+
+
 class BackupsProgress:
     def __init__(self, backups_runner: BackupsRunner, station_name: str, verbose: bool) -> None:
         self.backups_runner = backups_runner
         self.station_name = station_name
         self.verbose = verbose
-        self.prog = Progress(
-            TextColumn("{task.fields[num_position]}."),
-            SpinnerCheckXColumn(finished_text="✅"),
-            TextColumn("[progress.description]{task.fields[machine_name]}({task.fields[machine_ext_ip]}):"),
-            TextColumn("[progress.description]{task.description}"),
-            TimeElapsedColumn(),
-            transient=False,
-            disable=verbose,
-        )
+        self.prog: _RichProgress | _PlainProgress
+        if verbose:
+            self.prog = _PlainProgress()
+        else:
+            self.prog = _RichProgress(
+                TextColumn("{task.fields[num_position]}."),
+                SpinnerCheckXColumn(finished_text="✅"),
+                TextColumn("[progress.description]{task.fields[machine_name]}({task.fields[machine_ext_ip]}):"),
+                TextColumn("[progress.description]{task.description}"),
+                TimeElapsedColumn(),
+                transient=False,
+                # a few state changes per machine, the default 10 Hz redraw only
+                # competes for the GIL with the SSH worker threads
+                refresh_per_second=2,
+            )
 
         self.failures: list[tuple[str, str, str]] = [] # [(machine_name, machine_ip, error_message)]
         self.successes: list[tuple[str, str, str]] = []  # [(machine_name, machine_ip, success_message)]
@@ -50,8 +124,8 @@ class BackupsProgress:
         )
         self.prog.stop_task(task_id)
 
-        t = self.prog.tasks[task_id]
-        self.failures.append((t.fields['machine_name'], t.fields['machine_ext_ip'], description))
+        t = self.prog.task_fields(task_id)
+        self.failures.append((t['machine_name'], t['machine_ext_ip'], description))
 
     def _succeed_task(self, task_id: TaskID, description: str) -> None:
         self.prog.update(
@@ -63,8 +137,8 @@ class BackupsProgress:
         )
         self.prog.stop_task(task_id= task_id)
 
-        t = self.prog.tasks[task_id]
-        self.successes.append((t.fields['machine_name'], t.fields['machine_ext_ip'], description))
+        t = self.prog.task_fields(task_id)
+        self.successes.append((t['machine_name'], t['machine_ext_ip'], description))
 
     def _handle_backup_result(self, task_id: TaskID, backup_result: BackupResult) -> bool:
         if not backup_result.execution_result.success:
@@ -83,7 +157,13 @@ class BackupsProgress:
         
         return True
         
-    def _handle_file_copy(self, task_id: TaskID, backup_result: BackupResult, station_backups_dir: str) -> bool:
+    def _handle_file_copy(
+            self,
+            task_id: TaskID,
+            backup_result: BackupResult,
+            station_backups_dir: Path,
+            gateway_password: str,
+        ) -> bool:
         # Prefer internal_host; fall back to public SSH host if the internal is unset
         ssh_host = backup_result.gateway.internal_host or backup_result.gateway.host
 
@@ -99,12 +179,13 @@ class BackupsProgress:
                 "Internal bug: _handle_file_copy called with a missing remote backup filepath"
             )
 
-        cp_result = self.backups_runner.copy_remote_file_to_local_machine(
+        cp_result = self.backups_runner.sftp_get(
             remote_filepath= remote_filepath,
-            local_destination= station_backups_dir,
+            # full local filepath, named after the remote file
+            local_filepath= str(station_backups_dir / PurePosixPath(remote_filepath).name),
             ssh_host= ssh_host,
             ssh_user= backup_result.gateway.user,
-            ssh_password= backup_result.gateway.password.get_secret_value(),
+            ssh_password= gateway_password,
         )
 
         if not cp_result.success:
@@ -113,66 +194,146 @@ class BackupsProgress:
         
         return True
 
+    def _copy_and_finish(
+            self,
+            task_id: TaskID,
+            backup_result: BackupResult,
+            station_backups_dir: Path,
+            gateway_password: str,
+        ) -> None:
+        cp_succeed = self._handle_file_copy(
+            task_id= task_id,
+            backup_result= backup_result,
+            station_backups_dir= station_backups_dir,
+            gateway_password= gateway_password,
+        )
+        if cp_succeed:
+            msg = "Backup file succesfully copied from the CMC"
+            self._succeed_task(task_id= task_id, description= msg)
+
+    def _produce_backup_results(
+            self,
+            backups_iterator: Generator[BackupResult, None, None],
+            results: queue.Queue,
+            ordered_task_ids: list[TaskID],
+            stop: threading.Event,
+        ) -> None:
+        """
+        Producer stage: drives the backups generator and puts every result (or
+        the exception that stopped it) in `results`, then the end marker.
+        Stops as soon as `stop` is set, even while waiting for room in `results`.
+        """
+        try:
+            for task_id in ordered_task_ids:
+                if stop.is_set():
+                    break
+
+                if self.verbose:
+                    # verbose runs are serial, the next result is the next machine
+                    t = self.prog.task_fields(task_id)
+                    typer.echo(
+                        f"\n##{'*'*10}  Backup {t['machine_name']}({t['machine_ext_ip']})  {'*'*10}##\n"
+                    )
+
+                try:
+                    backup_result = next(backups_iterator)
+                except StopIteration:
+                    break
+
+                if not _put_unless_stopped(results, backup_result, stop):
+                    break
+        except Exception as e:
+            _put_unless_stopped(results, e, stop)
+        finally:
+            # run the generator cleanup (closes the SSH sessions) from this thread
+            backups_iterator.close()
+            _put_unless_stopped(results, _END_OF_RESULTS, stop)
+
     def run(self) -> BackupSummary:
         """
         Executes the progress bar over all targets,
         then returns (successes, failures), each a list of
         (station_name, ip_external, message) tuples.
+
+        Backups and file copies are pipelined: a producer thread keeps running
+        the backups while finished ones are copied from the CMC by a pool of
+        copy workers.
         """
         target_machines = self.backups_runner.get_target_machines()
         backups_iterator = self.backups_runner.backup_generator()
 
-        station_backups_dir = os.path.join(BACKUPS_DESTINATION_DIRECTORY, self.station_name, "")
-        os.makedirs(name= station_backups_dir, exist_ok=True)
+        station_backups_dir = Path(BACKUPS_DESTINATION_DIRECTORY, self.station_name)
+        station_backups_dir.mkdir(parents= True, exist_ok= True)
 
         with self.prog:
+            # one row per machine up front, results may arrive in any order
+            # when the runner works in parallel. {ip_external: task_id}
+            pending_tasks: dict[str, TaskID] = {}
             for idx, machine_data in enumerate(target_machines, start=1):
-                machine_name = machine_data["machine_name"]
-                machine_ext_ip = machine_data["ip_external"]
-
-                task_id = self.prog.add_task(
+                pending_tasks[machine_data["ip_external"]] = self.prog.add_task(
                     description= "Processing... ",
                     total= None,
                     num_position= idx,
-                    machine_name= machine_name,
-                    machine_ext_ip = machine_ext_ip,
+                    machine_name= machine_data["machine_name"],
+                    machine_ext_ip = machine_data["ip_external"],
                 )
 
-                if self.verbose:
-                    typer.echo(f"\n##{'*'*10}  Backup {machine_name}({machine_ext_ip})  {'*'*10}##\n")
+            # small bound: the producer may only run a couple of backups ahead of the copies
+            results: queue.Queue = queue.Queue(maxsize= 2)
+            stop = threading.Event()
+            producer = threading.Thread(
+                target= self._produce_backup_results,
+                args= (backups_iterator, results, list(pending_tasks.values()), stop),
+                daemon= True,
+            )
+            producer.start()
 
-                try:
-                    backup_result = next(backups_iterator)
-                except MachinePasswordMissingError as e:
-                    self.prog.stop_task(task_id= task_id)
-                    self.prog.remove_task(task_id= task_id)
-                    self.prog.stop()
-                    typer.echo(f"ERROR: {e}", err=True)
-                    
-                    raise typer.Exit(1)
-                
-                except StopIteration:
-                    # This exception in theory should never be reach, since the for loop
-                    # goes over all the target machines we should be try to connect to
-                    # if this exception is raise then a mismach happened(internal bug)
-                    self._fail_task(task_id= task_id, description= "Backup generator ended early.")
-                    # self.prog.remove_task(task_id= task_id)
-                    break
+            copies: list[Future] = []
+            # every result shares the station gateway, unwrap its password once
+            gateway_password: str | None = None
+            copy_executor = ThreadPoolExecutor(max_workers= MAX_PARALLEL_COPIES)
+            finished = False
+            try:
+                while (backup_result := results.get()) is not _END_OF_RESULTS:
+                    if isinstance(backup_result, MachinePasswordMissingError):
+                        self.prog.stop()
+                        typer.echo(f"ERROR: {backup_result}", err=True)
 
-                succeed = self._handle_backup_result(task_id= task_id, backup_result= backup_result)
-                if not succeed:
-                    continue
+                        raise typer.Exit(1)
 
-                cp_succeed = self._handle_file_copy(
-                    task_id= task_id,
-                    backup_result= backup_result,
-                    station_backups_dir= station_backups_dir
-                )
-                if not cp_succeed:
-                    continue
+                    if isinstance(backup_result, Exception):
+                        raise backup_result
+
+                    task_id = pending_tasks.pop(backup_result.target.host)
+
+                    succeed = self._handle_backup_result(task_id= task_id, backup_result= backup_result)
+                    if not succeed:
+                        continue
+
+                    if gateway_password is None:
+                        gateway_password = backup_result.gateway.password.get_secret_value()
+
+                    copies.append(copy_executor.submit(
+                        self._copy_and_finish, task_id, backup_result, station_backups_dir, gateway_password
+                    ))
+
+                # This in theory should never be reach, since the generator yields
+                # one result per target machine we should be try to connect to,
+                # if machines are left then a mismach happened(internal bug)
+                for task_id in pending_tasks.values():
+                    self._fail_task(task_id= task_id, description= "Backup generator ended early.")
 
-                msg = "Backup file succesfully copied from the CMC"
-                self._succeed_task(task_id= task_id, description= msg)
+                for copy in copies:
+                    copy.result()
+                finished = True
+            finally:
+                stop.set()
+                if not finished:
+                    # early exit (Ctrl-C, missing password, failed copy...): don't
+                    # wait for the backups and copies in flight (up to the script
+                    # timeout), closing their connections makes them fail now
+                    self.backups_runner.cancel()
+                copy_executor.shutdown(wait= finished, cancel_futures= True)
 
 
-        return BackupSummary(successes=self.successes, failures=self.failures)
\ No newline at end of file
+        return BackupSummary(successes=self.successes, failures=self.failures)
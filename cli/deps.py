@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from settings import (
+    STATIONS_GENERAL_INFO_JSON_FILE,
+    STATIONS_SECRETS_TEMPLATES_DIR,
+)
+
+if TYPE_CHECKING:
+    from features.stations.repository import StationDataRepository
+
+
+def get_stations_repo() -> StationDataRepository:
+    """
+    Shared StationDataRepository for the whole CLI process, rebuilt only
+    when general_info.json changes on disk.
+
+    Raises:
+        FileNotFoundError: If general_info.json does not exist.
+    """
+    return _stations_repo(os.stat(STATIONS_GENERAL_INFO_JSON_FILE).st_mtime_ns)
+
+@lru_cache(maxsize=1)
+def _stations_repo(general_info_mtime_ns: int) -> StationDataRepository:
+    from features.stations.repository import StationDataRepository
+
+    return StationDataRepository()
+
+
+def get_template_paths() -> list[str]:
+    """
+    Cached `StationSecretsHandler.get_template_paths`, rescanned only when
+    the templates directory changes.
+    """
+    try:
+        mtime_ns = os.stat(STATIONS_SECRETS_TEMPLATES_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return []
+
+    return list(_template_paths(mtime_ns))
+
+@lru_cache(maxsize=1)
+def _template_paths(templates_dir_mtime_ns: int) -> tuple[str, ...]:
+    from features.stations.secrets_handler import StationSecretsHandler
+
+    return tuple(StationSecretsHandler.get_template_paths())
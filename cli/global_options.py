@@ -0,0 +1,17 @@
+import click
+
+
+def get_global_option(name: str, default: bool = False) -> bool:
+    """
+    Return a root-level option stored by `cli.app.global_options`
+    (e.g. "no_banner"), or `default` when called outside a CLI run.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return default
+
+    options = ctx.find_root().obj
+    if not isinstance(options, dict):
+        return default
+
+    return options.get(name, default)
@@ -1,16 +1,13 @@
 import os
+import ipaddress
 from datetime import datetime
 from pydantic import (
     BaseModel,
-    IPvAnyAddress,
     Field,
 )
 
 from settings import BACKUP_FAILURES_JSON_FILE
-from utils import (
-    load_json_file,
-    write_json_file,
-)
+from utils import write_text_file_atomic
 
 
 class BackupFailureRecord(BaseModel):
@@ -18,14 +15,17 @@ class BackupFailureRecord(BaseModel):
         min_length= 1,
         description="Guardian label/name"
     )
-    ip: IPvAnyAddress = Field(
+    # plain str: records loaded back from our own file are not re-parsed,
+    # new ones are checked in `FailuresStore.add_failure`
+    ip: str = Field(
         description="External IP address of the machine"
     )
     error: str
 
 
 class StationFailures(BaseModel):
-    last_attempt: datetime
+    # None only in memory, until `FailuresStore.save` stamps it
+    last_attempt: datetime | None = None
     failures: list[BackupFailureRecord]
 
 
@@ -42,6 +42,12 @@ class FailuresStore:
 
     def __init__(self, path: str = BACKUP_FAILURES_JSON_FILE) -> None:
         self.path = path
+        # resolved once, astimezone() looks the local zone up on every call
+        self._tz = datetime.now().astimezone().tzinfo
+        # {station: failed IPs}, built on demand and dropped when the station changes
+        self._failed_ip_sets: dict[str, frozenset[str]] = {}
+        # stations whose last_attempt is stamped with the save time
+        self._stamp_on_save: set[str] = set()
         self.data = BackupFailuresFile(
             last_update= self._local_now(),
             stations= {}
@@ -49,7 +55,7 @@ class FailuresStore:
 
     def _local_now(self) -> datetime:
         """Current local time with timezone info."""
-        return datetime.now().astimezone()
+        return datetime.now(self._tz)
 
     def load(self) -> None:
         """
@@ -62,41 +68,98 @@ class FailuresStore:
         ValidationError
             If its contents do not conform to BackupFailuresFile schema.
         """        
-        raw_data = load_json_file(filepath= self.path)
-        self.data = BackupFailuresFile.model_validate(raw_data)
+        with open(self.path, "rb") as f:
+            self.data = BackupFailuresFile.model_validate_json(f.read())
+        self._failed_ip_sets.clear()
+        self._stamp_on_save.clear()
 
     def save(self) -> None:
-        """Write `self.data` to disk (pretty-printed JSON), updating the global timestamp."""
-        self.data.last_update = self._local_now()
-        write_json_file(filepath= self.path, data= self.data.model_dump(mode= "json"))
-
-    def add_failure(self, station: str, record: BackupFailureRecord, update_last_attempt: bool = True) -> None:
+        """
+        Write `self.data` to disk (pretty-printed JSON), updating the global
+        timestamp and the last attempt of the stations changed without an
+        explicit `now`.
+        """
+        now = self._local_now()
+        self.data.last_update = now
+        for station in self._stamp_on_save:
+            if station in self.data.stations:
+                self.data.stations[station].last_attempt = now
+        self._stamp_on_save.clear()
+
+        # pydantic's own serializer, no intermediate dict + json module pass
+        write_text_file_atomic(filepath= self.path, text= self.data.model_dump_json(indent= 4))
+
+    def add_failure(
+            self,
+            station: str,
+            record: BackupFailureRecord,
+            update_last_attempt: bool = True,
+            now: datetime | None = None,
+        ) -> None:
         """
         Append a failure record under the given station, creating the
         station entry if necessary.
+
+        Without `now` the station's last attempt is set to the time of
+        the next `save`, the clock is read once for all the records.
+
+        Raises
+        ------
+        ValueError
+            If `record.ip` is not a valid IP address.
         """
-        if station not in self.data.stations:
-            self.data.stations[station] = StationFailures(
-                last_attempt= self._local_now(),
+        record.ip = str(ipaddress.ip_address(record.ip))
+        self._failed_ip_sets.pop(station, None)
+
+        station_failures = self.data.stations.get(station)
+        if station_failures is None:
+            station_failures = self.data.stations[station] = StationFailures(
+                last_attempt= now,
                 failures= [],
             )
+            if now is None:
+                self._stamp_on_save.add(station)
 
-        self.data.stations[station].failures.append(record)
+        station_failures.failures.append(record)
         if update_last_attempt:
-            self.data.stations[station].last_attempt = self._local_now()
+            if now is None:
+                self._stamp_on_save.add(station)
+            else:
+                station_failures.last_attempt = now
 
-    def clear_station(self, station: str) -> None:
+    def clear_station(self, station: str, now: datetime | None = None) -> None:
         """Remove all stored failures for *station* """
+        self._failed_ip_sets.pop(station, None)
         if station in self.data.stations:
             self.data.stations[station].failures.clear()
-            self.data.stations[station].last_attempt = self._local_now()
+            if now is None:
+                self._stamp_on_save.add(station)
+            else:
+                self.data.stations[station].last_attempt = now
+
+    def get_stations_with_failures(self) -> list[str]:
+        """Return, in a single pass, the stations that have stored failures."""
+        return [
+            station
+            for station, station_failures in self.data.stations.items()
+            if station_failures.failures
+        ]
 
     def get_failed_ips(self, station: str) -> list[str]:
         """Return IPs that failed in the last run for *station*."""
         if station not in self.data.stations:
             return []
         
-        return [str(rec.ip) for rec in self.data.stations[station].failures]
+        return [rec.ip for rec in self.data.stations[station].failures]
+
+    def get_failed_ip_set(self, station: str) -> frozenset[str]:
+        """Same IPs as `get_failed_ips`, as a cached set for membership tests."""
+        failed_ips = self._failed_ip_sets.get(station)
+        if failed_ips is None:
+            failed_ips = frozenset(self.get_failed_ips(station))
+            self._failed_ip_sets[station] = failed_ips
+
+        return failed_ips
    
     @classmethod
     def clear(cls) -> None:
@@ -1,4 +1,7 @@
+import queue
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Iterator
 from socket import error as SocketError
@@ -7,17 +10,17 @@ from paramiko.ssh_exception import (
     AuthenticationException,
     NoValidConnectionsError,
 )
-from fabric import Connection
-from fabric.transfer import Result as TransferResult
-from invoke.exceptions import UnexpectedExit
+from paramiko import SFTPClient
 from pydantic import SecretStr
 
 from settings import (
     BASH_BACKUPS_SCRIPT,
     DEFAULT_SSH_USERNAME,
+    SSH_KEEPALIVE_INTERVAL,
 )
 
 from ssh.group import SerialRecursiveSSHGroup
+from ssh.pool import SSHConnectionPool
 from ssh.responders import Responder, SSH_CONNECTION_YES_NO_FINGERPRINT_RESPONDER
 from ssh.commands import TargetBashScript, TargetExecutionResult
 from ssh.base import SSHConnectionData, DEFAULT_SHELL_PROMPT_PATTERN
@@ -33,7 +36,66 @@ from features.stations.exceptions import (
 )
 
 
-REMOTE_BACKUP_FILEPATH_REGEX = re.compile(r'Backup file .* copied to .*?:(/.+?\.nozomi_backup)')
+# "[*] Backup file successfully copied to <user>@<host>:<path>.nozomi_backup", the
+# last line printed by the backups script, only its output tail is searched.
+REMOTE_BACKUP_FILEPATH_REGEX = re.compile(
+    r'Backup file \S+ copied to [^:\s]+:(/.+?\.nozomi_backup)\s*$',
+    re.MULTILINE,
+)
+REMOTE_BACKUP_FILEPATH_SEARCH_TAIL = 8192  # chars
+
+# SFTP reads kept in flight while copying a backup file (each read is at most
+# paramiko's 32 KiB request size), and the buffers rotated between the reading
+# and the writing side of the copy.
+SFTP_MAX_CONCURRENT_READS = 64
+COPY_BUFFERS = 4
+COPY_BUFFER_SIZE = 1 << 20
+
+
+def _copy_buffered(src, dst) -> int:
+    """
+    Copy file object *src* into *dst* with the write side in its own thread:
+    a buffer is filled from *src* while previously filled ones are written to
+    *dst*, so network and disk work overlap. Returns the bytes copied.
+
+    Errors from either side are raised in the calling thread.
+    """
+    free_buffers: queue.Queue[bytearray] = queue.Queue()
+    for _ in range(COPY_BUFFERS):
+        free_buffers.put(bytearray(COPY_BUFFER_SIZE))
+    filled_buffers: queue.Queue[tuple[bytearray, int] | None] = queue.Queue()
+    write_errors: list[BaseException] = []
+
+    def writer() -> None:
+        while (item := filled_buffers.get()) is not None:
+            buf, n = item
+            if not write_errors:
+                try:
+                    dst.write(memoryview(buf)[:n])
+                except BaseException as e:
+                    write_errors.append(e)
+            free_buffers.put(buf)
+
+    writer_thread = threading.Thread(target= writer, daemon= True)
+    writer_thread.start()
+
+    copied = 0
+    try:
+        while not write_errors:
+            buf = free_buffers.get()
+            n = src.readinto(buf)
+            if not n:
+                break
+            filled_buffers.put((buf, n))
+            copied += n
+    finally:
+        filled_buffers.put(None)
+        writer_thread.join()
+
+    if write_errors:
+        raise write_errors[0]
+
+    return copied
 
 
 @dataclass
@@ -52,7 +114,7 @@ class RemoteFileCopyResult:
     remote: str                                  # remote filepath you asked for
     local: str                                   # local destination
     success: bool                                # overall outcome
-    result: TransferResult | None = None         # present only on success
+    result: int | None = None                    # bytes copied, present only on success
     error: Exception | None = None               # present only on failure
 
 
@@ -66,6 +128,9 @@ class BackupsRunner:
             shell_prompt_timeout: float,    # seconds
             verbose: bool,
             ssh_username: str = DEFAULT_SSH_USERNAME,
+            connection_pool: SSHConnectionPool | None = None,
+            max_workers: int = 1,
+            keepalive_interval: int = SSH_KEEPALIVE_INTERVAL,   # seconds, 0 = off
         ):
         self.station_data = station_data
         self.station_secrets = station_secrets
@@ -76,6 +141,26 @@ class BackupsRunner:
         self.shell_prompt_timeout = shell_prompt_timeout
         
         self.verbose = verbose
+        self._hide = not verbose
+        # number of targets backed up at the same time (1 = serial)
+        self.max_workers = max_workers
+
+        # connections to the gateway (shells and file copies), if no pool is
+        # shared by the caller the runner's own is used.
+        self.connection_pool = connection_pool or SSHConnectionPool(keepalive_interval= keepalive_interval)
+        # workers of the running parallel backups, see `cancel`
+        self._executor: ThreadPoolExecutor | None = None
+
+        # station machines split once, the getters below are called several times per run
+        self._cmc_machine: dict | None = None
+        self._cmc_count = 0
+        self._target_machines: list[dict] = []
+        for m in station_data:
+            if m["type"] == "CMC":
+                self._cmc_machine = m
+                self._cmc_count += 1
+            elif m["type"] == "GUARDIAN" and m["state"] != "pendiente":
+                self._target_machines.append(m)
 
     def build_scp_responders(self, password: str) -> list[Responder]:
         """ build passwor responder for the scp(secure copy) command """
@@ -102,112 +187,108 @@ class BackupsRunner:
         CorruptedDataFileError
             If zero or more than one CMC entry is found.
         """
-        cmc_list = [m for m in self.station_data if m["type"] == "CMC"]
-        if len(cmc_list) != 1:
+        if self._cmc_machine is None or self._cmc_count != 1:
             # each station should only have one CMC
             raise CorruptedDataFileError(
-                f"Expected exactly one CMC entry, found {len(cmc_list)}."
+                f"Expected exactly one CMC entry, found {self._cmc_count}."
             )
-        return cmc_list[0]
+        return self._cmc_machine
     
     def get_target_machines(self) -> list[dict]:
         """
         Return the subset of ``self.station_data`` eligible for backup
         (currently: type == "GUARDIAN" and state != "pendiente").
         """
-        return [
-            m
-            for m in self.station_data
-            if m["type"] == "GUARDIAN" and m["state"] != "pendiente"
-        ]
+        return self._target_machines
     
-    def build_gateway_ssh_connection_data_instance(self) -> SSHConnectionData:
-        cmc_data = self.get_gateway_machine()
-        cmc_password = self.get_machine_password(machine_external_ip= cmc_data["ip_external"])
+    def _build_all_connection_data(self) -> tuple[SSHConnectionData, list[SSHConnectionData]]:
+        """
+        Build, in a single pass over the machines, the gateway (CMC)
+        SSHConnectionData and one for each machine returned by
+        `get_target_machines`.
 
-        connection_data = SSHConnectionData(
+        Raises
+        ------
+        CorruptedDataFileError
+            If the station does not have exactly one CMC.
+        MachinePasswordMissingError
+            If a machine has no configured password.
+        """
+        cmc_data = self.get_gateway_machine()
+        gateway_connection_data = SSHConnectionData(
             host= cmc_data["ip_external"],
             user= self.ssh_username,
-            password= SecretStr(cmc_password),
+            password= SecretStr(self.get_machine_password(machine_external_ip= cmc_data["ip_external"])),
             internal_host= cmc_data["ip_internal"],
         )
-        
-        return connection_data
-
-    def build_target_ssh_connection_data_instances(self) -> list[SSHConnectionData]:
-        """
-        Build SSHConnectionData objects for each machine returned by
-        the method `get_target_machines`.
-        """
-        targets_connection_data: list[SSHConnectionData] = []
 
-        for machine in self.get_target_machines():                
-            external_ip = machine["ip_external"]
-            password = self.get_machine_password(machine_external_ip= external_ip)
-            
-            c_data = SSHConnectionData(
-                host= external_ip,
+        targets_connection_data = [
+            SSHConnectionData(
+                host= machine["ip_external"],
                 user= self.ssh_username,
-                password= SecretStr(password),
+                password= SecretStr(self.get_machine_password(machine_external_ip= machine["ip_external"])),
                 internal_host= machine["ip_internal"]
             )
+            for machine in self.get_target_machines()
+        ]
 
-            targets_connection_data.append(c_data)
-
-
-        return targets_connection_data
+        return gateway_connection_data, targets_connection_data
     
-    def copy_remote_file_to_local_machine(
+    def sftp_get(
             self,
             remote_filepath: str,
-            local_destination: str,
+            local_filepath: str,
             ssh_user: str,
             ssh_host: str,
             ssh_password: str,
         ) -> RemoteFileCopyResult:
-        """Copy *remote_filepath* to *local_destination*, always returning a result wrapper."""
-        # building Fabric connection
-        fabric_connection = Connection(
-            f"{ssh_user}@{ssh_host}",
-            connect_kwargs={"password": f"{ssh_password}"}
-        )
+        """
+        Copy *remote_filepath* to *local_filepath* over SFTP, always returning
+        a result wrapper.
 
+        The SFTP channel is opened on the pooled, already authenticated transport
+        to the host, so no new SSH connection or login happens per file.
+        """
         try:
+            transport = self.connection_pool.get(
+                host= ssh_host,
+                user= ssh_user,
+                password= ssh_password,
+                connect_timeout= self.connection_timeout,
+            ).transport
+
             # coping backup file from the gateway(the CMC) to my local machine
-            result = fabric_connection.get(remote_filepath, local_destination)
+            with SFTPClient.from_transport(transport) as sftp: # type: ignore
+                with sftp.open(remote_filepath, "rb") as remote_file:
+                    size = remote_file.stat().st_size
+                    # pipeline the reads instead of one round trip per chunk
+                    remote_file.prefetch(size, max_concurrent_requests= SFTP_MAX_CONCURRENT_READS)
+                    with open(local_filepath, "wb") as f:
+                        _copy_buffered(remote_file, f)
 
             return RemoteFileCopyResult(
                 success= True,
-                local= result.local,
-                remote= result.remote,
-                result= result,
+                local= local_filepath,
+                remote= remote_filepath,
+                result= size,
                 error= None,
             )
 
-        # network / auth / banner / TCP problems
+        # network / auth / banner / TCP problems, missing remote file, local I/O errors
         except (
             TimeoutError, # socket.timeout is just an alias to TimeoutError
-            SocketError,
+            SocketError,  # alias of OSError, also covers IOError from SFTP
             AuthenticationException,
             NoValidConnectionsError,            
             SSHException,
         ) as e:
             return RemoteFileCopyResult(
                 success= False,
-                local= local_destination,
+                local= local_filepath,
                 remote= remote_filepath,
                 result= None,
                 error= e,
             )
-        
-        except UnexpectedExit as e:
-            return RemoteFileCopyResult(
-                success= False,
-                local= local_destination,
-                remote= remote_filepath,
-                result= None,
-                error= e,   
-            )
     
 
     def _run_and_extract_backup_path(
@@ -222,7 +303,7 @@ class BackupsRunner:
         returns a BackupResult.
         """
         try:
-            t_result = group.run_target(target=target, commands=[script], hide= not self.verbose)
+            t_result = group.run_target(target=target, commands=[script], hide= self._hide)
         except (
             GatewaySessionInactiveError,
             GatewaySSHConnectionError,
@@ -249,7 +330,10 @@ class BackupsRunner:
             )
         
         script_output, _ = t_result.outputs[0]
-        match = REMOTE_BACKUP_FILEPATH_REGEX.search(script_output)
+        tail = script_output[-REMOTE_BACKUP_FILEPATH_SEARCH_TAIL:]
+        # jump straight to the last candidate line, the regex only confirms it
+        line_pos = tail.rfind("Backup file ")
+        match = REMOTE_BACKUP_FILEPATH_REGEX.match(tail, line_pos) if line_pos != -1 else None
 
         # extract remote backup filepath
         remote_path = match.group(1) if match else None
@@ -261,47 +345,48 @@ class BackupsRunner:
             remote_backup_filepath= remote_path
         )
 
-    def backup_generator(self) -> Iterator[BackupResult]:
-        """
-        For each GUARDIAN target:
-        1. Runs the backup script on the target via the CMC gateway.
-        2. Parses out the remote .nozomi_backup filepath (or yields None).
-        3. Yields (host, remote_path, result) so the caller can handle fetching.
-        """
-        script_file = BASH_BACKUPS_SCRIPT
-        
-        gateway_connection_data = self.build_gateway_ssh_connection_data_instance()
-        targets_connection_data = self.build_target_ssh_connection_data_instances()
-
-        scp_responders = self.build_scp_responders(password= gateway_connection_data.password.get_secret_value())
-
-        script_cmd = TargetBashScript(
-            script= script_file,
-            args= [
-                gateway_connection_data.user,
-                gateway_connection_data.host,    
-            ],
-            from_file= True,
-            run_as_root= True,
-            responders= scp_responders,
-            timeout= self.script_timeout,
-            hide_output= not self.verbose,
-        )
-
-        serial_ssh_group = SerialRecursiveSSHGroup(
-            gateway_data= gateway_connection_data,
-            targets= targets_connection_data,
+    def _build_ssh_group(
+            self,
+            gateway_data: SSHConnectionData,
+            targets: list[SSHConnectionData],
+        ) -> SerialRecursiveSSHGroup:
+        gateway_password = gateway_data.password.get_secret_value()
+
+        def gateway_transport():
+            # gateway shells ride the pooled connection as extra channels, so
+            # workers, session restarts and the file copies to the same host
+            # share one TCP connection and key exchange
+            return self.connection_pool.get(
+                host= gateway_data.host,
+                user= gateway_data.user,
+                password= gateway_password,
+                connect_timeout= self.connection_timeout,
+            ).transport
+
+        return SerialRecursiveSSHGroup(
+            gateway_data= gateway_data,
+            targets= targets,
             shell_gateway_prompt_pattern= DEFAULT_SHELL_PROMPT_PATTERN,
             shell_target_prompt_pattern= DEFAULT_SHELL_PROMPT_PATTERN,
             connection_timeout= self.connection_timeout,
-            shell_prompt_timeout= self.shell_prompt_timeout
+            shell_prompt_timeout= self.shell_prompt_timeout,
+            gateway_transport_provider= gateway_transport,
         )
+
+    def _serial_backups(
+            self,
+            gateway_data: SSHConnectionData,
+            targets: list[SSHConnectionData],
+            script: TargetBashScript,
+        ) -> Iterator[BackupResult]:
+        """Back up the targets one after the other over a single gateway session."""
+        serial_ssh_group = self._build_ssh_group(gateway_data, targets)
         try:
             for target in serial_ssh_group.targets:
                 backup_result = self._run_and_extract_backup_path(
                     group= serial_ssh_group,
                     target= target,
-                    script= script_cmd
+                    script= script
                 )
             
                 if not backup_result.execution_result.success:
@@ -316,3 +401,92 @@ class BackupsRunner:
         finally:
             serial_ssh_group.close()
 
+    def _parallel_backups(
+            self,
+            gateway_data: SSHConnectionData,
+            targets: list[SSHConnectionData],
+            script: TargetBashScript,
+        ) -> Iterator[BackupResult]:
+        """
+        Back up the targets concurrently. Every worker thread owns its own
+        gateway session (reused for all the targets it handles) and results
+        are yielded in completion order, not in target order.
+        """
+        thread_local = threading.local()
+        groups: list[SerialRecursiveSSHGroup] = []
+        groups_lock = threading.Lock()
+
+        def backup_one(target: SSHConnectionData) -> BackupResult:
+            group = getattr(thread_local, "group", None)
+            if group is None:
+                group = self._build_ssh_group(gateway_data, targets)
+                thread_local.group = group
+                with groups_lock:
+                    groups.append(group)
+
+            backup_result = self._run_and_extract_backup_path(group= group, target= target, script= script)
+            if not backup_result.execution_result.success:
+                # this foces the worker session to start from zero for its next target
+                group.close()
+
+            return backup_result
+
+        executor = ThreadPoolExecutor(max_workers= min(self.max_workers, len(targets)))
+        self._executor = executor
+        try:
+            futures = [executor.submit(backup_one, target) for target in targets]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait= True, cancel_futures= True)
+            self._executor = None
+            for group in groups:
+                group.close()
+
+    def cancel(self) -> None:
+        """
+        Abort the running backups (e.g. on Ctrl-C) without waiting for them:
+        the targets not started yet are dropped and the pooled connections are
+        closed, so the commands in flight fail at once instead of running until
+        their timeout.
+        """
+        executor = self._executor
+        if executor is not None:
+            executor.shutdown(wait= False, cancel_futures= True)
+        self.connection_pool.close_all()
+
+    def backup_generator(self) -> Iterator[BackupResult]:
+        """
+        For each GUARDIAN target:
+        1. Runs the backup script on the target via the CMC gateway.
+        2. Parses out the remote .nozomi_backup filepath (or yields None).
+        3. Yields a BackupResult so the caller can handle fetching.
+
+        With ``max_workers > 1`` (and not verbose) the targets are backed up
+        concurrently and results come in completion order; use
+        ``BackupResult.target.host`` to match them with their machine.
+        """
+        script_file = BASH_BACKUPS_SCRIPT
+        
+        gateway_connection_data, targets_connection_data = self._build_all_connection_data()
+
+        scp_responders = self.build_scp_responders(password= gateway_connection_data.password.get_secret_value())
+
+        script_cmd = TargetBashScript(
+            script= script_file,
+            args= [
+                gateway_connection_data.user,
+                gateway_connection_data.host,    
+            ],
+            from_file= True,
+            run_as_root= True,
+            responders= scp_responders,
+            timeout= self.script_timeout,
+            hide_output= self._hide,
+        )
+
+        # verbose output streams the remote shells, it only makes sense serially
+        if self.max_workers > 1 and not self.verbose and len(targets_connection_data) > 1:
+            yield from self._parallel_backups(gateway_connection_data, targets_connection_data, script_cmd)
+        else:
+            yield from self._serial_backups(gateway_connection_data, targets_connection_data, script_cmd)
@@ -1,24 +1,94 @@
+import os
+
 from settings import (
     STATION_MACHINES_DATA_SHEET,
     STATIONS_GENERAL_INFO_JSON_FILE,
+    STATIONS_JSONS_CHECKSUM_FILE,
+    CHECKSUM_CACHE_FILE,
 )
 
+from utils import load_json_file, write_json_file
 from features.stations.utils import verify_stations_xls_file_checksum
 from features.stations.repository import StationDataRepository
 from exceptions import ChecksumVerificationError
 
 
+## ────────── Verified-files cache ────────── ##
+# Remembers (st_mtime_ns, st_size) of the files that last passed a check,
+# so an unchanged set of files is not hashed again on every command.
+
+def _files_signature(filepaths: list[str]) -> dict[str, list[int]] | None:
+    """Return {path: [mtime_ns, size]} or None if any file can't be stat'ed."""
+    signature = {}
+    for path in filepaths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        signature[path] = [st.st_mtime_ns, st.st_size]
+
+    return signature
+
+def _load_cache() -> dict:
+    try:
+        return load_json_file(CHECKSUM_CACHE_FILE)
+    except (OSError, ValueError):
+        return {}
+
+def _is_verified(key: str, filepaths: list[str]) -> bool:
+    signature = _files_signature(filepaths)
+    return signature is not None and _load_cache().get(key) == signature
+
+def _set_verified(key: str, filepaths: list[str], verified: bool) -> None:
+    cache = _load_cache()
+    signature = _files_signature(filepaths) if verified else None
+    if signature is None:
+        cache.pop(key, None)
+    else:
+        cache[key] = signature
+
+    try:
+        write_json_file(CHECKSUM_CACHE_FILE, cache)
+    except OSError:
+        # the cache is only an optimization
+        pass
+
+def _checksum_file_entries(checksum_file: str) -> list[str]:
+    """Filepaths listed in a `<hash>  <filepath>` checksum file."""
+    try:
+        with open(checksum_file, "r", encoding="utf-8") as f:
+            return [parts[1] for parts in (line.split() for line in f) if len(parts) == 2]
+    except OSError:
+        return []
+
+
 def verify_xls_checksum() -> bool:
-    return verify_stations_xls_file_checksum(
+    files = [STATION_MACHINES_DATA_SHEET, STATIONS_GENERAL_INFO_JSON_FILE]
+    if _is_verified("xls", files):
+        return True
+
+    match = verify_stations_xls_file_checksum(
         xls_file=STATION_MACHINES_DATA_SHEET,
         json_checksum_file=STATIONS_GENERAL_INFO_JSON_FILE,
     )
+    _set_verified("xls", files, match)
+
+    return match
 
 
 def verify_station_json_data_files_checksums(stations_data_repo: StationDataRepository) -> bool:
+    files = [STATIONS_JSONS_CHECKSUM_FILE] + _checksum_file_entries(STATIONS_JSONS_CHECKSUM_FILE)
+    if _is_verified("stations_json", files):
+        return True
+
     try:
-        return stations_data_repo.verify_stations_data_checksum_file()
+        is_valid = stations_data_repo.verify_stations_data_checksum_file()
     except FileNotFoundError as e:
         raise e
     except ChecksumVerificationError as e:
+        _set_verified("stations_json", files, False)
         raise e
+
+    _set_verified("stations_json", files, is_valid)
+
+    return is_valid
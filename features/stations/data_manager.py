@@ -1,12 +1,15 @@
 import os
-from typing import Iterator
-import pandas as pd
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import Iterable, Iterator
+from openpyxl import Workbook, load_workbook
 from pydantic import ValidationError
 
 import utils
 import log_utils
 
-from features.stations.schemas import StationRow
+from features.stations.schemas import validate_station_row
 from features.stations.exceptions import InvalidExcelFormatError, InvalidExcelRowError
 
 
@@ -33,6 +36,7 @@ class StationDataManager:
         "ip_internal",
         "state",
     )
+    COLUMN_NAMES_SET = frozenset(COLUMN_NAMES)
 
     STATE_VALUES = (
         "instalada",
@@ -41,6 +45,12 @@ class StationDataManager:
         "pendiente",
     )
 
+    # workbooks smaller than this are normalized in-process
+    PARALLEL_LOAD_MIN_FILE_SIZE = 2 * 1024 * 1024  # bytes
+
+    # threads writing the per-sheet JSON files
+    EXPORT_MAX_WORKERS = 4
+
     def __init__(
             self,
             xls_file: str,
@@ -64,18 +74,102 @@ class StationDataManager:
         if not os.path.isdir(stations_data_dir):
             raise NotADirectoryError(f"Directory not found: {stations_data_dir}")
 
-        self._xls = pd.ExcelFile(xls_file)
-        self.normalized_data: dict[str, pd.DataFrame] = {}
+        self._wb: Workbook | None = None
+        self._sheet_names = [str(name) for name in self._workbook().sheetnames]
+        self._sheet_headers: dict[str, list[str]] = {}
+        self.normalized_data: dict[str, list[dict]] = {}
+        # filepath → SHA-256 of the files written by this manager
+        self._written_checksums: dict[str, str] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _workbook(self) -> Workbook:
+        """The open workbook, (re)opened on demand after `close`."""
+        if self._wb is None:
+            # read-only: cells are streamed from the file instead of loading the whole workbook
+            self._wb = load_workbook(self.xls_path, read_only= True, data_only= True)
+
+        return self._wb
+
+    def close(self) -> None:
+        """
+        Release the Excel file handle. Called once `load_sheet_data` is done,
+        the normalized data does not need the workbook anymore.
+        """
+        if self._wb is not None:
+            self._wb.close()
+            self._wb = None
 
     def get_sheet_names(self) -> list[str]:
         """
         Retrieves the names of all sheets in the Excel file.
 
         Returns:
-            list[str]: List of sheet names as strings.
+            list[str]: List of sheet names as strings. The list is read once
+                when the workbook is opened, callers must not mutate it.
+        """
+        return self._sheet_names
+
+    def _iter_sheet_rows(self, sheet: str, max_row: int | None = None) -> Iterator[tuple]:
+        """Stream the raw cell values of *sheet*, row by row."""
+        ws = self._workbook()[sheet]
+        # the stored sheet dimension can be wrong (e.g. files written by other
+        # tools), let openpyxl read up to the last actual cell
+        ws.reset_dimensions() # type: ignore
+        return ws.iter_rows(max_row= max_row, values_only= True)
+
+    @staticmethod
+    def _parse_headers(row: tuple) -> list[str]:
+        """Column names of a header row, trailing empty cells dropped."""
+        headers = list(row)
+        while headers and headers[-1] is None:
+            headers.pop()
+
+        return [f"Unnamed: {i}" if h is None else str(h) for i, h in enumerate(headers)]
+
+    def get_sheet_headers(self, sheet: str) -> list[str]:
         """
-        # Convert all sheet names to str
-        return [str(name) for name in self._xls.sheet_names]
+        Reads only the first row of *sheet*, once per sheet.
+
+        Returns:
+            list[str]: The column names, callers must not mutate the list.
+        """
+        if sheet not in self._sheet_headers:
+            row = next(self._iter_sheet_rows(sheet, max_row= 1), ())
+            self._sheet_headers[sheet] = self._parse_headers(row)
+
+        return self._sheet_headers[sheet]
+
+    def _iter_sheet_records(self, sheet: str) -> Iterator[dict]:
+        """
+        Stream the rows of *sheet* as {column_name: value} dicts, empty cells
+        as None. Blank rows at the end of the sheet are skipped.
+        """
+        rows = self._iter_sheet_rows(sheet)
+        next(rows, None)  # header row, already parsed by get_sheet_headers
+        headers = self.get_sheet_headers(sheet)
+        width = len(headers)
+
+        blank_rows = 0  # held back until a non-blank row shows they are not trailing
+        for row in rows:
+            row = row[:width]
+            if all(value is None for value in row):
+                blank_rows += 1
+                continue
+
+            for _ in range(blank_rows):
+                yield dict.fromkeys(headers)
+            blank_rows = 0
+
+            record = dict(zip(headers, row))
+            if len(row) < width:
+                for h in headers[len(row):]:
+                    record[h] = None
+            yield record
         
     def validate_columns(self) -> None:
         """
@@ -85,18 +179,18 @@ class StationDataManager:
             InvalidExcelFormatError: If there are missing or unexpected columns in any sheet.
         """
         for sheet in self.get_sheet_names():
-            df = self._xls.parse(sheet, nrows=0)  # only read headers
+            actual = self.get_sheet_headers(sheet)  # only read headers
 
-            if len(df.columns) > len(self.COLUMN_NAMES):
+            if len(actual) > len(self.COLUMN_NAMES):
                 raise InvalidExcelFormatError(
-                    f"Sheet '{sheet}' has {len(df.columns)} columns, only {len(self.COLUMN_NAMES)} are allow.\
+                    f"Sheet '{sheet}' has {len(actual)} columns, only {len(self.COLUMN_NAMES)} are allow.\
                     The only allow columns are: {self.COLUMN_NAMES}"
                 )
 
-            actual = df.columns.tolist()
-
-            missing = [col for col in self.COLUMN_NAMES if col not in actual]
-            unexpected = [col for col in actual if col not in self.COLUMN_NAMES]
+            # set lookups, lists kept in sheet/declaration order for the message
+            actual_set = frozenset(actual)
+            missing = [col for col in self.COLUMN_NAMES if col not in actual_set]
+            unexpected = [col for col in actual if col not in self.COLUMN_NAMES_SET]
 
             if missing or unexpected:
                 error_msg = f"Sheet '{sheet}' mismatch:"
@@ -107,12 +201,12 @@ class StationDataManager:
 
                 raise InvalidExcelFormatError(f"Columns names validation error. {error_msg}")
 
-    def _normalize_rows(self, records: list[dict]) -> Iterator[dict]:
+    def _normalize_rows(self, records: Iterable[dict]) -> Iterator[dict]:
         """
-        Normalizes and validates each row in a list of station records.
+        Normalizes and validates each row of station records.
 
         Args:
-            records (list[dict]): List of dicts representing Excel rows.
+            records (Iterable[dict]): Dicts representing Excel rows, can be streamed.
 
         Yields:
             dict: Validated and normalized row data.
@@ -122,15 +216,7 @@ class StationDataManager:
         """
         for i, record in enumerate(records, start=1):
             try:
-                row = StationRow(**record)
-                data = row.model_dump() # return dict, not pydantic model
-
-                if data["ip_internal"] is not None:
-                    data["ip_internal"] = str(data["ip_internal"])
-                if data["ip_external"] is not None:
-                    data["ip_external"] = str(data["ip_external"])
-
-                yield data
+                yield validate_station_row(record)
 
             except ValidationError as e:
                 raise InvalidExcelRowError(
@@ -139,55 +225,90 @@ class StationDataManager:
                     sheet_name= None,
                 )
     
-    def load_sheet_data(self, sheet_names: list[str]) -> dict[str, pd.DataFrame]:
+    def _normalize_sheet(self, sheet: str) -> list[dict]:
+        """
+        Loads and normalizes one sheet.
+
+        Returns:
+            list[dict]: Normalized rows.
+
+        Raises:
+            InvalidExcelRowError: If a row fails validation.
+        """
+        # rows are streamed from the workbook, never held as a second full copy
+        records = self._iter_sheet_records(sheet)
+
+        try:
+            return list(self._normalize_rows(records))
+        except InvalidExcelRowError as e:
+            e.sheet_name = sheet
+            raise e
+            # raise ValueError(
+            #     f"Validation error while normalizing data from sheet '{sheet}'"
+            #     ) from e            
+
+    def load_sheet_data(self, sheet_names: list[str]) -> dict[str, list[dict]]:
         """
         Loads and normalizes data from specified Excel sheets.
 
+        Sheets of large workbooks (see `PARALLEL_LOAD_MIN_FILE_SIZE`) are
+        normalized in parallel worker processes, small ones serially since
+        starting the workers would cost more than the work itself. The Excel
+        file is closed once done (see `close`).
+
         Args:
             sheet_names (list[str]): Sheet names to load and validate.
 
         Returns:
-            dict[str, pd.DataFrame]: Normalized data indexed by sheet name.
+            dict[str, list[dict]]: Normalized rows indexed by sheet name.
 
         Raises:
             ValueError: If validation fails for any row in any sheet.
             InvalidExcelFormatError: If there are missing or unexpected columns in any sheet.
         """
-        self.validate_columns()
-
-        for sheet in sheet_names:
-            df = self._xls.parse(sheet)
-            # Replace NaN with None
-            df = df.where(pd.notnull(df), None)
-            records = df.to_dict(orient='records')
-            
-            try:
-                normalized_iter = self._normalize_rows(records)
-                normalized_df = pd.DataFrame(normalized_iter)
-            except InvalidExcelRowError as e:
-                e.sheet_name = sheet
-                raise e
-                # raise ValueError(
-                #     f"Validation error while normalizing data from sheet '{sheet}'"
-                #     ) from e            
-
-            self.normalized_data[sheet] = normalized_df
+        try:
+            self.validate_columns()
+
+            results: list[list[dict]] | None = None
+            if (
+                len(sheet_names) > 1
+                and _FORK_CONTEXT is not None
+                and os.path.getsize(self.xls_path) >= self.PARALLEL_LOAD_MIN_FILE_SIZE
+            ):
+                max_workers = min(len(sheet_names), os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers= max_workers, mp_context= _FORK_CONTEXT) as executor:
+                    results = list(executor.map(
+                        _normalize_sheet_in_worker,
+                        repeat(self.xls_path),
+                        repeat(self.stations_data_dir),
+                        sheet_names,
+                    ))
+
+            if results is None:
+                results = [self._normalize_sheet(sheet) for sheet in sheet_names]
+
+            for sheet, rows in zip(sheet_names, results):
+                self.normalized_data[sheet] = rows
+        finally:
+            self.close()
 
         return self.normalized_data
     
     def get_data_as_dict(self, sheet_names: list[str]) -> dict[str, list[dict]]:
         """
-        Converts normalized data into JSON-serializable format.
+        Returns the normalized data of the given sheets, already in
+        JSON-serializable format.
 
         Args:
             sheet_names (list[str]): List of sheet names to include in output.
 
         Returns:
-            dict[str, list[dict]]: Dictionary of lists of row dictionaries.
+            dict[str, list[dict]]: Dictionary of lists of row dictionaries,
+                callers must not mutate them.
         """
         return {
-            sheet_name: df.to_dict(orient="records")
-            for sheet_name, df in self.normalized_data.items()
+            sheet_name: rows
+            for sheet_name, rows in self.normalized_data.items()
             if sheet_name in sheet_names
         }
 
@@ -216,23 +337,29 @@ class StationDataManager:
         if not os.path.exists(self.stations_data_dir):
             os.mkdir(self.stations_data_dir)  # Only create the last-level directory
         
-        records = self.get_data_as_dict(sheet_names)
-        # check for empty dict, no sheets found
-        if not records: 
+        sheets = list(self.get_data_as_dict(sheet_names).items())
+        # check for empty list, no sheets found
+        if not sheets: 
             log_utils.log_info(
                 "Nothing to write: no matching sheets found in normalized_data",
                 logger
             )
             return []
 
-        json_filespaths = []
-        for sheet, data in records.items():
+        def write_sheet(sheet: str, rows: list[dict]) -> str:
             filename = f"{sheet}{self.JSON_FILENAME_SUFFIX}"
             filepath = os.path.join(self.stations_data_dir, filename)
-            utils.write_json_file(filepath, {sheet: data}, indent= indent)
-            json_filespaths.append(filepath)
+            self._written_checksums[filepath] = utils.write_json_file(
+                filepath, {sheet: rows}, indent= indent
+            )
+            return filepath
+
+        if len(sheets) == 1:
+            return [write_sheet(*sheets[0])]
 
-        return json_filespaths
+        # overlap the file writes of the sheets, paths keep the sheets order
+        with ThreadPoolExecutor(max_workers= min(len(sheets), self.EXPORT_MAX_WORKERS)) as executor:
+            return list(executor.map(write_sheet, *zip(*sheets)))
 
     def create_checksum_file(self, file_list: list[str], output_file: str) -> None:
         """
@@ -242,7 +369,10 @@ class StationDataManager:
             file_list (list[str]): Paths of files to include in the checksum.
             output_file (str): Path to the output checksum file.
         """
-        utils.generate_sha256_checksum_file(file_list, output_file)
+        # files this manager just wrote are not read back to hash them
+        utils.generate_sha256_checksum_file(
+            file_list, output_file, known_checksums= self._written_checksums
+        )
 
     def _create_general_info_json(self) -> str:
         """
@@ -276,7 +406,7 @@ class StationDataManager:
 
         filename = "general_info.json"
         filepath = os.path.join(self.stations_data_dir, filename)
-        utils.write_json_file(filepath, data)
+        self._written_checksums[filepath] = utils.write_json_file(filepath, data)
 
         return filepath
 
@@ -303,6 +433,7 @@ class StationDataManager:
 
         if clear_directory:
             utils.clear_direcroty(self.stations_data_dir)
+            self._written_checksums.clear()
 
         json_files = self.export_sheet_to_json_files(sheet_names)
         genaral_info_file = self._create_general_info_json()
@@ -312,4 +443,21 @@ class StationDataManager:
         self.create_checksum_file(json_files, checksum_file)
         
         return json_files + [checksum_file]
-    
+
+
+# Workers are forked: a spawned one would re-import `log_utils`, whose
+# logging setup truncates the log file (the default LOG_FILE_MODE is "w").
+# Without fork (e.g. Windows) the sheets are loaded serially.
+_FORK_CONTEXT = (
+    multiprocessing.get_context("fork")
+    if "fork" in multiprocessing.get_all_start_methods()
+    else None
+)
+
+def _normalize_sheet_in_worker(xls_file: str, stations_data_dir: str, sheet: str) -> list[dict]:
+    """
+    Process pool entry point: normalizes *sheet* with a manager (and workbook)
+    of its own. Errors are raised in the parent process through the future.
+    """
+    with StationDataManager(xls_file, stations_data_dir) as manager:
+        return manager._normalize_sheet(sheet)
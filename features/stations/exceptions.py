@@ -1,4 +1,7 @@
+from typing import get_args
 from pydantic import ValidationError
+from pydantic_core import PydanticCustomError
+from pydantic_core.core_schema import ErrorType
 
 
 class InvalidExcelFormatError(ValueError):
@@ -42,6 +45,50 @@ class InvalidExcelRowError(ValueError):
 
         return f"{msg}\n{self.validation_error}"
 
+    def __reduce__(self):
+        # keyword-only __init__, and pydantic can't unpickle errors of custom
+        # types (e.g. "ip_any_address"): rebuild from plain data, so the error
+        # survives pickling (it is raised in process pool workers)
+        return (
+            _rebuild_invalid_excel_row_error,
+            (
+                self.row_index,
+                self.sheet_name,
+                self.validation_error.title,
+                self.validation_error.errors(include_url= False),
+            ),
+        )
+
+
+_PYDANTIC_ERROR_TYPES = frozenset(get_args(ErrorType))
+
+def _rebuild_invalid_excel_row_error(
+        row_index: int,
+        sheet_name: str | None,
+        title: str,
+        errors: list[dict],
+    ) -> InvalidExcelRowError:
+    line_errors = []
+    for error in errors:
+        error_type = error["type"]
+        if error_type in _PYDANTIC_ERROR_TYPES:
+            line_error = {"type": error_type, "loc": error["loc"], "input": error["input"]}
+            if "ctx" in error:
+                line_error["ctx"] = error["ctx"]
+        else:
+            line_error = {
+                "type": PydanticCustomError(error_type, error["msg"]),
+                "loc": error["loc"],
+                "input": error["input"],
+            }
+        line_errors.append(line_error)
+
+    return InvalidExcelRowError(
+        row_index= row_index,
+        sheet_name= sheet_name,
+        validation_error= ValidationError.from_exception_data(title, line_errors),
+    )
+
 
 class CorruptedDataFileError(Exception):
     """
@@ -1,4 +1,6 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import Literal
 
 import utils
@@ -23,6 +25,9 @@ class StationDataRepository:
     - Load station data from general_info.json and per-station JSON files.
     - Load and decrypt station secrets using StationSecretsHandler.
     """
+    # threads reading station data files at once
+    LOAD_MAX_WORKERS = 8
+
     def __init__(
         self,
     ) -> None:
@@ -30,23 +35,34 @@ class StationDataRepository:
 
         # Caches
         self._data_cache: dict[str, list[dict]] = {}
+        self._index_cache: dict[tuple[str, str, bool, bool], dict[str, dict]] = {}
 
     def _load_general_info(self) -> dict:
         return utils.load_json_file(STATIONS_GENERAL_INFO_JSON_FILE)
     
-    def get_stations_data_files(self) -> dict[str, str]:
+    @cached_property
+    def _stations_data_files(self) -> dict[str, str]:
         try:
             return self._general_info["stations_data"]
         except KeyError:
             raise CorruptedDataFileError(f"'stations_data' key is missing from {STATIONS_GENERAL_INFO_JSON_FILE}")
-    
-    def get_station_names(self) -> list[str]:        
-        keys = self.get_stations_data_files().keys()
+
+    @cached_property
+    def _station_names(self) -> list[str]:
+        keys = self._stations_data_files.keys()
         if len(keys) == 0:
             raise CorruptedDataFileError(f"'stations_data' key in {STATIONS_GENERAL_INFO_JSON_FILE} does not contain any station entries")
-        
+
         return list(keys)
 
+    def get_stations_data_files(self) -> dict[str, str]:
+        """Station name → data file name, callers must not mutate it."""
+        return self._stations_data_files
+    
+    def get_station_names(self) -> list[str]:
+        """Names of the stored stations, callers must not mutate the list."""
+        return self._station_names
+
     def get_station_data(self, station_name: str) -> list[dict]:
         """
         Returns cached data if available, otherwise loads from file and caches it.
@@ -78,12 +94,30 @@ class StationDataRepository:
         return content
     
     def load_multiple_stations_data(self, station_names: list[str]) -> dict[str, list[dict]]:
-        result: dict[str, list[dict]] = {}
-        for name in station_names:
-            content = self.load_station_data(station_name= name)
-            result[name] = content
+        if len(station_names) < 2:
+            return {name: self.load_station_data(station_name= name) for name in station_names}
+
+        # overlap the file reads, results keep the given order
+        with ThreadPoolExecutor(max_workers= min(len(station_names), self.LOAD_MAX_WORKERS)) as executor:
+            contents = executor.map(self.load_station_data, station_names)
+            return dict(zip(station_names, contents))
 
-        return result
+    def load_all_stations_data(self, station_names: list[str] | None = None) -> dict[str, list[dict]]:
+        """
+        Fill the data cache in one batched read: every station not cached yet
+        (of *station_names*, all the stored stations by default) is loaded at
+        once, later `get_station_data` calls are served from memory.
+
+        Returns:
+            dict[str, list[dict]]: Mapping of station name → list of machine records.
+        """
+        if station_names is None:
+            station_names = self.get_station_names()
+
+        missing = [name for name in station_names if name not in self._data_cache]
+        self._data_cache.update(self.load_multiple_stations_data(missing))
+
+        return {name: self._data_cache[name] for name in station_names}
 
     def verify_stations_data_checksum_file(self) -> bool:
         try:
@@ -120,7 +154,8 @@ class StationDataRepository:
 
         Returns:
             dict[str, dict]
-                Mapping ``key → machine-dict`` for that station.
+                Mapping ``key → machine-dict`` for that station. The index is
+                cached per arguments, callers must not mutate it.
 
         Examples
         --------
@@ -134,21 +169,30 @@ class StationDataRepository:
         if by not in allowed:
             raise ValueError(f"'by' must be one of {allowed}")
 
-        data = self.get_station_data(station_name)
-        result: dict[str, dict] = {}
+        cache_key = (station_name, by, skip_missing, crash_on_duplicates)
+        if cache_key in self._index_cache:
+            return self._index_cache[cache_key]
 
-        for machine in data:
-            key_val = machine.get(by, None)
-            if key_val is None:
-                if skip_missing:
-                    continue
+        data = self.get_station_data(station_name)
+        items = [(machine.get(by), machine) for machine in data]
+        if any(key_val is None for key_val, _ in items):
+            if not skip_missing:
+                machine = next(machine for key_val, machine in items if key_val is None)
                 raise KeyError(f"Machine is missing '{by}': {machine}")
+            items = [item for item in items if item[0] is not None]
+
+        result: dict[str, dict] = dict(items)
 
-            if crash_on_duplicates and key_val in result:
-                raise ValueError(
-                    f"Duplicate value '{key_val}' for key '{by}' in '{station_name}' data"
-                )
+        if crash_on_duplicates and len(result) != len(items):
+            # only on failure: report the first repeated key, as found in the rows
+            seen: set[str] = set()
+            for key_val, _ in items:
+                if key_val in seen:
+                    raise ValueError(
+                        f"Duplicate value '{key_val}' for key '{by}' in '{station_name}' data"
+                    )
+                seen.add(key_val)
 
-            result[key_val] = machine
+        self._index_cache[cache_key] = result
 
         return result
\ No newline at end of file
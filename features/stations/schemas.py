@@ -1,9 +1,11 @@
+import ipaddress
 import unicodedata
 from typing import (
     Annotated,
     Iterable,
     Literal,
     Optional,
+    get_args,
 )
 from pydantic import (
     BaseModel,
@@ -17,6 +19,16 @@ from pydantic import (
 )
 
 
+def _to_ascii(value: str) -> str:
+    """Strip `value` and drop its accents, keeping only ASCII characters."""
+    value = value.strip()
+    if value.isascii():
+        # nothing to decompose, NFKD would return it unchanged
+        return value
+
+    return unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
+
+
 class StationRow(BaseModel):
     """
     Pydantic model representing a single row of station data from an Excel sheet.
@@ -57,8 +69,7 @@ class StationRow(BaseModel):
         - Stripping leading/trailing whitespace
         - Removing accents and converting to closest ASCII equivalent
         """
-        value = value.strip()
-        return unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
+        return _to_ascii(value)
     
     @model_validator(mode="after")
     def validate_ips_if_needed(self):
@@ -72,6 +83,68 @@ class StationRow(BaseModel):
         return self
 
 
+_STATION_ROW_TYPES = frozenset(get_args(StationRow.model_fields["type"].annotation))
+_STATION_ROW_STATES = frozenset(get_args(StationRow.model_fields["state"].annotation))
+
+
+def _ascii_lower(value: str) -> str:
+    """Same normalization as the StationRow `machine_name`/`state` validators."""
+    return _to_ascii(value).lower()
+
+
+def _station_row_ip(value) -> str | None:
+    if value is None:
+        return None
+    if type(value) is str and ":" not in value:
+        # a dotted quad that parses is already in canonical form: only check it
+        ipaddress.IPv4Address(value)
+        return value
+    return str(ipaddress.ip_address(value))
+
+
+def validate_station_row(record: dict) -> dict:
+    """
+    Validate and normalize one station row, returning the same dict as
+    `StationRow(**record).model_dump()` with the IPs as strings.
+
+    Plainly valid rows (the vast majority) are checked inline, anything else
+    goes through `StationRow` so errors are reported exactly as before.
+
+    Raises:
+        ValidationError: If the row does not conform to `StationRow`.
+    """
+    try:
+        machine_type = record["type"]
+        machine_name = record["machine_name"]
+        state = record["state"]
+        if isinstance(machine_type, str) and isinstance(machine_name, str) and isinstance(state, str):
+            data = {
+                "type": machine_type.upper(),
+                "machine_name": _ascii_lower(machine_name),
+                "ip_external": _station_row_ip(record["ip_external"]),
+                "ip_internal": _station_row_ip(record["ip_internal"]),
+                "state": _ascii_lower(state),
+            }
+            if (
+                data["type"] in _STATION_ROW_TYPES
+                and data["state"] in _STATION_ROW_STATES
+                and (
+                    data["state"] == "pendiente"
+                    or (data["ip_external"] is not None and data["ip_internal"] is not None)
+                )
+            ):
+                return data
+    except (KeyError, ValueError):
+        pass
+
+    data = StationRow(**record).model_dump()
+    for key in ("ip_external", "ip_internal"):
+        if data[key] is not None:
+            data[key] = str(data[key])
+
+    return data
+
+
 class StationsSecretsTemplate(RootModel):
     """
     Root: { "<STATION_NAME>": { <IPvAnyAddress>: <SecretStr>, ... } }
@@ -81,7 +154,7 @@ class StationsSecretsTemplate(RootModel):
     - The outer dict contains *exactly* one station.
     - If context["expected_station_name"] is provided, the name must match.
     - If context["expected_ips"] is provided, the inner dict must contain
-      exactly those IPs (order-insensitive).
+      exactly those IPs (order-insensitive). A set or frozenset is used as is.
     """
     root: dict[
         str, # station name
@@ -111,7 +184,8 @@ class StationsSecretsTemplate(RootModel):
                 "Station must have at least one device/IP."
             )
 
-        expected_station = info.context.get("expected_station_name") if info.context else None
+        context = info.context or {}
+        expected_station = context.get("expected_station_name")
 
         # Optional station-name check
         if expected_station and station_name != expected_station:
@@ -121,13 +195,12 @@ class StationsSecretsTemplate(RootModel):
             )
         
         # Optional IP list check
-        expected_ips: Iterable[str] | None = (
-            info.context.get("expected_ips") if info.context else None
-        )
+        expected_ips: Iterable[str] | None = context.get("expected_ips")
 
         if expected_ips is not None:
             actual_ips = {str(k) for k in self.root[station_name].keys()}
-            expected_set = set(expected_ips)
+            # callers can pass a (frozen)set to skip this copy
+            expected_set = expected_ips if isinstance(expected_ips, (set, frozenset)) else set(expected_ips)
 
             if actual_ips != expected_set:
                 raise ValueError(
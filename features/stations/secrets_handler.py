@@ -1,8 +1,11 @@
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable
 from cryptography.fernet import Fernet, InvalidToken
 from pydantic import ValidationError
+from pydantic_core import to_json
 
 from settings import (
     STATIONS_SECRETS_TEMPLATES_DIR,
@@ -33,6 +36,9 @@ class StationSecretsHandler:
     TEMPLATES_SUFFIX = "_secrets.json"
     ENCRYPTED_TEMPLATES_SUFFIX= "_secrets.json.enc"
 
+    # threads encrypting templates at once
+    ENCRYPT_MAX_WORKERS = 8
+
     def __init__(
             self,
             key: str | bytes,
@@ -44,6 +50,19 @@ class StationSecretsHandler:
             key (str | bytes): Fernet key used to encrypt and decrypt secrets.
         """
         self.encryption_key = key
+        self._fernet: Fernet | None = None
+
+        # Caches: station name → (encrypted file mtime_ns, decrypted secrets)
+        self._secrets_cache: dict[str, tuple[int, dict[str, str]]] = {}
+        # station name → encrypted secrets filepath
+        self._encrypted_paths: dict[str, str] = {}
+
+    def _get_fernet(self) -> Fernet:
+        """The Fernet instance for the handler key, built (and the key parsed) once."""
+        if self._fernet is None:
+            self._fernet = Fernet(self.encryption_key)
+
+        return self._fernet
 
     def decrypt_fernet_file(self, filepath: str) -> bytes:
         """
@@ -61,7 +80,7 @@ class StationSecretsHandler:
         """
         encrypted = Path(filepath).read_bytes()
         try: 
-            fernet = Fernet(self.encryption_key)
+            fernet = self._get_fernet()
             decrypted = fernet.decrypt(encrypted)
 
         except ValueError as e: #handle Fernet class initializaton errors
@@ -84,7 +103,7 @@ class StationSecretsHandler:
             TypeError: If the input data is not in byte format.
         """
         try:
-            fernet = Fernet(self.encryption_key)
+            fernet = self._get_fernet()
             encrypted = fernet.encrypt(data)
             Path(filepath).write_bytes(encrypted)
         except ValueError as e:
@@ -104,13 +123,14 @@ class StationSecretsHandler:
         """
         decrypted_bytes = self.decrypt_fernet_file(filepath)
 
-        return json.loads(decrypted_bytes.decode("utf-8"))
+        # json.loads detects the UTF-8 bytes itself, no decoded copy needed
+        return json.loads(decrypted_bytes)
 
     def save_encrypted_json(
             self,
             filepath: str,
             data: dict,
-            indent: int | None = 4
+            indent: int | None = None
         ) -> None:
         """
         Serializes a dictionary to JSON, encrypts it, and saves it to a file.
@@ -118,9 +138,13 @@ class StationSecretsHandler:
         Args:
             filepath (str): Path where the encrypted JSON file will be saved.
             data (dict): Data to serialize and encrypt.
-            indent (int | None): Number of spaces for JSON indentation. Use None for compact output.
+            indent (int | None): Number of spaces for JSON indentation. Defaults to
+                None, compact output: the file is never read by a person and every
+                byte is encrypted, authenticated and base64-encoded.
         """
-        json_bytes = json.dumps(data, indent= indent).encode("utf-8")
+        # pydantic-core's serializer returns UTF-8 bytes directly, compact
+        # (no separator spaces) unless indented
+        json_bytes = to_json(data, indent= indent)
         self.encrypt_fernet_file(json_bytes, filepath)
     
     @classmethod
@@ -128,15 +152,23 @@ class StationSecretsHandler:
         """
         Return paths of every *_secrets.json file found in
         STATIONS_SECRETS_TEMPLATES_DIR.  Does **no** I/O besides the directory
-        scan.
+        scan (a single `os.scandir` pass, no per-file stat on most platforms).
         """
-        pattern = f"*{cls.TEMPLATES_SUFFIX}"
-        return sorted(
-            utils.list_directory(
-                directory= STATIONS_SECRETS_TEMPLATES_DIR,
-                include_patterns= [pattern],
+        # same path form as `utils.list_directory`
+        base = str(Path(STATIONS_SECRETS_TEMPLATES_DIR))
+        try:
+            entries = os.scandir(base)
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+        with entries:
+            return sorted(
+                os.path.join(base, entry.name)
+                for entry in entries
+                if entry.name.endswith(cls.TEMPLATES_SUFFIX)
+                and not entry.name.startswith(".")
+                and entry.is_file()
             )
-        )
 
     @classmethod
     def generate_secrets_templates(
@@ -165,14 +197,13 @@ class StationSecretsHandler:
             # one global key that is the name of the station
             station_name = next(iter(data))
 
-            new_data = {}
-            for machine in data[station_name]:
-                ip = machine["ip_external"]
-                if ip is None:
-                    continue
-                # format "<external_ip>": "<password>"
-                new_data[ip] = ""
-            
+            # format "<external_ip>": "<password>"
+            new_data = {
+                ip: ""
+                for machine in data[station_name]
+                if (ip := machine["ip_external"]) is not None
+            }
+
             filename = f"{station_name}{cls.TEMPLATES_SUFFIX}"
             filepath = os.path.join(output_dir, filename)
             utils.write_json_file(filepath, {station_name: new_data}, indent= indent)
@@ -180,15 +211,25 @@ class StationSecretsHandler:
 
         return json_filespaths
     
-    def validate_template_data(self, data: dict[str, dict[str, str]]) -> None:
-        """Validate the JSON structure and cross-check it against station data."""
+    def validate_template_data(
+            self,
+            data: dict[str, dict[str, str]],
+            stations_repo: StationDataRepository | None = None,
+        ) -> None:
+        """
+        Validate the JSON structure and cross-check it against station data.
+
+        Pass *stations_repo* when validating several templates, so the stations
+        data is loaded once instead of once per template.
+        """
         if len(data) != 1:
             raise SecretsTemplateValidationError("create corrupted template file eerror")
 
-        try:
-            stations_repo = StationDataRepository()
-        except FileNotFoundError as e:
-            raise e
+        if stations_repo is None:
+            try:
+                stations_repo = StationDataRepository()
+            except FileNotFoundError as e:
+                raise e
         
         stations_names = stations_repo.get_station_names()
         template_station = next(iter(data)) # same as list(data.keys())[0]
@@ -197,11 +238,11 @@ class StationSecretsHandler:
             raise SecretsTemplateValidationError("create corrupted template file eerror")
         
         station_data = stations_repo.get_station_data(template_station)
-        station_ips = [
-            m["ip_external"]
+        station_ips = frozenset(
+            ip
             for m in station_data
-            if m["ip_external"] is not None
-        ]
+            if (ip := m["ip_external"]) is not None
+        )
 
         try:
             StationsSecretsTemplate.model_validate(
@@ -214,12 +255,27 @@ class StationSecretsHandler:
         except ValidationError as e:
             raise e
         
-    def validate_template_file(self, filepath: str) -> None:
-        """Load a template file from disk and validate its contents."""
+    def validate_template_file(
+            self,
+            filepath: str,
+            stations_repo: StationDataRepository | None = None,
+        ) -> dict[str, dict[str, str]]:
+        """
+        Load a template file from disk, validate its contents and return them,
+        so they can be encrypted (`encrypt_secrets_template_data`) without
+        reading the file again.
+        """
         tempalte_data = utils.load_json_file(filepath= filepath)
-        self.validate_template_data(data= tempalte_data)
+        self.validate_template_data(data= tempalte_data, stations_repo= stations_repo)
+
+        return tempalte_data
     
-    def encrypt_secrets_template(self, template_path: str, validate: bool = True) -> str:
+    def encrypt_secrets_template(
+            self,
+            template_path: str,
+            validate: bool = True,
+            stations_repo: StationDataRepository | None = None,
+        ) -> str:
         """
         Encrypt **one** *_secrets.json template and return the path created.
 
@@ -228,6 +284,8 @@ class StationSecretsHandler:
             Absolute or relative path to a single template JSON file.
         validate : bool
             Validate the JSON before writing (default True).
+        stations_repo : StationDataRepository | None
+            Stations data to validate against, loaded from disk if None.
 
         Returns:
             str: Filepath to the encrypted file.
@@ -235,17 +293,28 @@ class StationSecretsHandler:
        
         data = utils.load_json_file(template_path)
         if validate:
-            self.validate_template_data(data= data)
+            self.validate_template_data(data= data, stations_repo= stations_repo)
+
+        return self.encrypt_secrets_template_data(data= data)
+
+    def encrypt_secrets_template_data(self, data: dict[str, dict[str, str]]) -> str:
+        """
+        Encrypt the already loaded (and validated) contents of **one** template
+        and return the path created.
 
+        Args:
+            data (dict): Template contents ({"<station_name>": {"<ip>": "<password>"}}).
+
+        Returns:
+            str: Filepath to the encrypted file.
+        """
         # Get the single key. The json shuold only have
         # one global key that is the name of the station
         station_name = next(iter(data))
         
-        outfile = os.path.join(
-            STATIONS_SECRETS_ENCRYPTED_DIR,
-            f"{station_name}{self.ENCRYPTED_TEMPLATES_SUFFIX}",
-        )
+        outfile = self._encrypted_secret_filepath(station_name)
         self.save_encrypted_json(outfile, data)
+        self.invalidate(station_name)
         
         return outfile
     
@@ -256,6 +325,22 @@ class StationSecretsHandler:
             outfiles.append(encrypted_file)
 
         return outfiles
+
+    def encrypt_multiple_secrets_templates_data(self, templates_data: list[dict[str, dict[str, str]]]) -> list[str]:
+        """
+        Encrypt already loaded (and validated) templates concurrently.
+
+        Returns:
+            list[str]: Filepaths to the encrypted files, in the order of *templates_data*.
+        """
+        if len(templates_data) <= 1:
+            return [self.encrypt_secrets_template_data(data= data) for data in templates_data]
+
+        # one Fernet shared read-only by the threads; OpenSSL releases the GIL
+        # while encrypting and the file writes overlap too
+        self._get_fernet()
+        with ThreadPoolExecutor(max_workers= min(len(templates_data), self.ENCRYPT_MAX_WORKERS)) as executor:
+            return list(executor.map(self.encrypt_secrets_template_data, templates_data))
     
     def remove_secrets_templates(self) -> None:
         """
@@ -266,6 +351,15 @@ class StationSecretsHandler:
         """
         utils.clear_direcroty(dir_path= STATIONS_SECRETS_TEMPLATES_DIR)
     
+    def _encrypted_secret_filepath(self, station_name: str) -> str:
+        """Path of the station's encrypted secrets file, built once per station."""
+        filepath = self._encrypted_paths.get(station_name)
+        if filepath is None:
+            filepath = os.path.join(STATIONS_SECRETS_ENCRYPTED_DIR, f"{station_name}{self.ENCRYPTED_TEMPLATES_SUFFIX}")
+            self._encrypted_paths[station_name] = filepath
+
+        return filepath
+
     def load_encrypted_secret_file(self, station_name: str) -> dict[str, str]:
         """
         Loads and decrypts secrets for the given station name.
@@ -276,7 +370,7 @@ class StationSecretsHandler:
         Returns:
             dict[str, str]: station secrets dictionary ({"ip": "password"}).
         """      
-        filepath = os.path.join(STATIONS_SECRETS_ENCRYPTED_DIR, f"{station_name}{self.ENCRYPTED_TEMPLATES_SUFFIX}")
+        filepath = self._encrypted_secret_filepath(station_name)
         decrypted_data = self.load_encrypted_json(filepath)
 
         return decrypted_data[station_name]
@@ -284,6 +378,76 @@ class StationSecretsHandler:
     def get_station_secrets(self, station_name: str) -> dict[str, str]:
         """
         Returns cached secrets if available, otherwise loads from file and caches them.
+
+        The cache entry is tied to the encrypted file's modification time, a
+        file re-encrypted since (by this or another process) is decrypted again.
+        Callers must not mutate the returned dict.
+        """
+        filepath = self._encrypted_secret_filepath(station_name)
+        try:
+            mtime_ns = os.stat(filepath).st_mtime_ns
+        except OSError:
+            # let the load raise its usual error for a missing file
+            mtime_ns = None
+
+        cached = self._secrets_cache.get(station_name)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        secrets = self.load_encrypted_json(filepath)[station_name]
+        if mtime_ns is not None:
+            self._secrets_cache[station_name] = (mtime_ns, secrets)
+
+        return secrets
+
+    def preload_all(self, station_names: Iterable[str] | None = None) -> dict[str, dict[str, str]]:
+        """
+        Decrypt the secrets files of *station_names* (every encrypted file
+        found if None) in one pass and cache them for `get_station_secrets`.
+
+        Files that are missing or cannot be decrypted are skipped here, the
+        later `get_station_secrets` call raises their usual error.
+
+        Returns:
+            dict[str, dict[str, str]]: station name → secrets, of the stations loaded.
         """
-        return self.load_encrypted_secret_file(station_name= station_name)
+        suffix = self.ENCRYPTED_TEMPLATES_SUFFIX
+        wanted = None if station_names is None else set(station_names)
+        loaded: dict[str, dict[str, str]] = {}
+
+        try:
+            entries = list(os.scandir(STATIONS_SECRETS_ENCRYPTED_DIR))
+        except OSError:
+            return loaded
+
+        for entry in entries:
+            if not entry.name.endswith(suffix) or not entry.is_file():
+                continue
+
+            station_name = entry.name[:-len(suffix)]
+            if wanted is not None and station_name not in wanted:
+                continue
+
+            try:
+                mtime_ns = entry.stat().st_mtime_ns
+                cached = self._secrets_cache.get(station_name)
+                if cached is not None and cached[0] == mtime_ns:
+                    loaded[station_name] = cached[1]
+                    continue
+
+                secrets = self.load_encrypted_json(entry.path)[station_name]
+            except (OSError, ValueError, TypeError, KeyError, InvalidToken):
+                continue
+
+            self._secrets_cache[station_name] = (mtime_ns, secrets)
+            loaded[station_name] = secrets
+
+        return loaded
+
+    def invalidate(self, station_name: str | None = None) -> None:
+        """Drop the cached secrets of *station_name*, or of every station if None."""
+        if station_name is None:
+            self._secrets_cache.clear()
+        else:
+            self._secrets_cache.pop(station_name, None)
 
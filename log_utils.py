@@ -1,3 +1,4 @@
+import sys
 import logging
 from settings import LOG_FILE, LOG_FILE_MODE
 
@@ -8,13 +9,37 @@ logging.basicConfig(
     level= logging.INFO,
     format='%(asctime)s - %(levelname)s [%(filename)s]: %(message)s',
     # datefmt='%Y-%m-%d %H:%M:%S',
-    # handlers=[
-    #     logging.FileHandler("app.log"),    # Log to file
-    #     logging.StreamHandler()             # Log to console (stdout)
-    # ]
 )
 
 
+class _ConsoleHandler(logging.Handler):
+    """
+    Echoes to stdout the records logged through the `log_*` helpers below
+    (marked with `extra={"console": True}`), so every message is formatted
+    once and dispatched to the log file and the console by a single call.
+    Other records (libraries, plain `logger.*` calls) only go to the file.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self.addFilter(lambda record: getattr(record, "console", False))
+
+    def format(self, record: logging.LogRecord) -> str:
+        msg = record.getMessage()
+        return msg if record.levelno == logging.INFO else f"{record.levelname}: {msg}"
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            # sys.stdout looked up per record: follows redirections (e.g. Rich)
+            sys.stdout.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+
+logging.getLogger().addHandler(_ConsoleHandler())
+
+_CONSOLE = {"console": True}
+
+
 def log_info(
         msg: str,
         logger: logging.Logger | None = None,
@@ -29,8 +54,7 @@ def log_info(
     if logger is None:
         logger = logging.getLogger()
     
-    logger.info(msg)
-    print(msg)
+    logger.info(msg, extra= _CONSOLE)
 
 def log_warning(
         msg: str,
@@ -46,12 +70,12 @@ def log_warning(
     if logger is None:
         logger = logging.getLogger()
     
-    logger.warning(msg)
-    print(f"WARNING: {msg}")
+    logger.warning(msg, extra= _CONSOLE)
 
 def log_debug(msg: str, logger: logging.Logger | None = None) -> None:
     """
-    Logs a debug message and prints it to the console with a 'DEBUG:' prefix.
+    Logs a debug message and prints it to the console with a 'DEBUG:' prefix,
+    only when the logger has DEBUG enabled.
 
     Args:
         msg (str): The debug message to log.
@@ -59,5 +83,6 @@ def log_debug(msg: str, logger: logging.Logger | None = None) -> None:
     """
     if logger is None:
         logger = logging.getLogger()
-    logger.debug(msg)
-    print(f"DEBUG: {msg}")
\ No newline at end of file
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug(msg, extra= _CONSOLE)
@@ -1,7 +1,29 @@
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+
+def _find_dotenv() -> str | None:
+    """
+    Same lookup as `dotenv.find_dotenv()` called from here: the first `.env`
+    file in this file's directory or any of its parents.
+    """
+    path = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        candidate = os.path.join(path, ".env")
+        if os.path.isfile(candidate):
+            return candidate
+
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+# python-dotenv is only imported when there is a .env file to load
+_dotenv_file = _find_dotenv()
+if _dotenv_file is not None:
+    from dotenv import load_dotenv
+
+    load_dotenv(_dotenv_file)
 
 DEBUG: bool = os.getenv("DEBUG", "false").lower().strip() == "true"
 
@@ -26,6 +48,8 @@ STATIONS_SECRETS_ENCRYPTED_DIR = os.path.join(STATIONS_SECRETS_DIRECTORY, "encry
 
 STATIONS_SECRETS_TEMPLATES_DIR = os.path.join(STATIONS_SECRETS_DIRECTORY, "templates")
 
+CHECKSUM_CACHE_FILE = os.path.join(DATA_DIR, "checksum_cache.json")
+
 # STATIONS_SECRETS_CHECKSUM_FILE = os.path.join(STATIONS_SECRETS_DIRECTORY, "sha256sum.txt")
 
 BACKUPS_DESTINATION_DIRECTORY = os.path.join(DATA_DIR, "nozomi_backups")
@@ -41,6 +65,20 @@ BASH_BACKUPS_SCRIPT = os.path.join(BASH_SCRIPTS_DIRECTORY, "backups.sh")
 
 DEFAULT_SSH_USERNAME = "admin"
 
+# Backup files copied from the CMC at the same time, while later backups run.
+MAX_PARALLEL_COPIES = int(os.getenv("MAX_PARALLEL_COPIES", "4"))
+# sshd MaxSessions of the CMCs, caps --max-parallel to
+# GATEWAY_MAX_SESSIONS - MAX_PARALLEL_COPIES so no channel open is refused.
+GATEWAY_MAX_SESSIONS = int(os.getenv("GATEWAY_MAX_SESSIONS", "10"))
+MAX_PARALLEL_BACKUPS_LIMIT = max(1, GATEWAY_MAX_SESSIONS - MAX_PARALLEL_COPIES)
+# Guardians backed up at the same time within a station. Every worker and
+# every running copy is a channel on one connection to the CMC, so a larger
+# value (e.g. an older .env with 8) is clamped to the limit above.
+MAX_PARALLEL_BACKUPS = min(int(os.getenv("MAX_PARALLEL_BACKUPS", "6")), MAX_PARALLEL_BACKUPS_LIMIT)
+# Seconds between SSH keepalives, so idle sessions to the CMC are not dropped
+# by NAT/firewalls during long backups. 0 disables them.
+SSH_KEEPALIVE_INTERVAL = int(os.getenv("SSH_KEEPALIVE_INTERVAL", "30"))
+
 DEFAULT_CLI_NAME = "narbal"
 
 VERSION = "0.1.0"
\ No newline at end of file
@@ -1,9 +1,11 @@
+import re
 from enum import IntEnum
 from pydantic.dataclasses import dataclass
 from pydantic import SecretStr, Field
 
 
 DEFAULT_SHELL_PROMPT_PATTERN: str = r"[^@\s]+@[^;\s]+[:\s].*[$#%>]"
+DEFAULT_SHELL_PROMPT_RE: re.Pattern = re.compile(DEFAULT_SHELL_PROMPT_PATTERN)
   
 
 class InternalExitCode(IntEnum):
@@ -21,7 +23,7 @@ class InternalExitCode(IntEnum):
     BREAK_TRIGGERED = -2          # Special break condition triggered
 
 
-@dataclass
+@dataclass(slots=True)
 class SSHConnectionData:
     """
     Container for SSH connection parameters.
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from .responders import Responder
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetCommand:
     """
     Represents a regular shell command to be executed on a target machine,
@@ -24,7 +24,7 @@ class TargetCommand:
     run_as_root: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetBashScript:
     """
     Represents a multi-line bash script to be executed on a target machine.
@@ -49,7 +49,7 @@ class TargetBashScript:
     run_as_root: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetExecutionResult:
     """
     Holds the result of executing a list of commands on a target machine.
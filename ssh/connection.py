@@ -1,19 +1,64 @@
 import time
 import re
+import codecs
+import socket
 import paramiko
 
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
-from .base import InternalExitCode, DEFAULT_SHELL_PROMPT_PATTERN
+from .base import InternalExitCode, DEFAULT_SHELL_PROMPT_RE
 from .responders import Responder, get_sudo_password_responder
 from .formatter import CommandFormatter
 from .exceptions import (
     PromptTimeoutError,
     CommandTimeoutError,
+    ChannelClosedError,
     ExitCodeNotFoundError,
 )
 
 
+@lru_cache(maxsize=None)
+def _compile(pattern: str) -> re.Pattern:
+    # the same few prompt/break patterns are used for every command of every host
+    return re.compile(pattern)
+
+def _as_regex(pattern: str | re.Pattern) -> re.Pattern:
+    return pattern if isinstance(pattern, re.Pattern) else _compile(pattern)
+
+# leading global inline flags, e.g. the "(?i)" of "(?i)password:"
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?([aiLmsux]+)\)")
+
+def _any_of_regex(patterns: list[str]) -> re.Pattern | None:
+    """
+    One regex matching wherever any of *patterns* matches, so a single scan
+    tells whether any of them is present. None if they can't be combined.
+    """
+    alternatives = []
+    for pattern in patterns:
+        # global flags are only allowed at the very start of a regex,
+        # embedded they must become a scoped group
+        match = _GLOBAL_FLAGS_RE.match(pattern)
+        if match:
+            alternatives.append(f"(?{match.group(1)}:{pattern[match.end():]})")
+        else:
+            alternatives.append(f"(?:{pattern})")
+
+    try:
+        return _compile("|".join(alternatives))
+    except re.error:
+        return None
+
+def _rescan_start(output: str) -> int:
+    """
+    Where the next search over the growing *output* has to start: the start of
+    its second to last line. Prompts and markers fit in a line (the prompt
+    pattern may span one line break), so the text before can't produce a new match.
+    """
+    last_newline = output.rfind("\n")
+    return output.rfind("\n", 0, max(last_newline, 0)) + 1
+
+
 class SSHConnection:
     """
     Manages an interactive SSH session over Paramiko.
@@ -21,22 +66,50 @@ class SSHConnection:
     This class maintains a persistent shell session with a remote host and allows sending 
     commands, handling prompts interactively, running scripts, and managing privilege escalation.
     """
-    RECV_BUFFER_SIZE = 4096 
-
-    def __init__(self, hostname: str, username: str, password: str, port: int = 22) -> None:
+    RECV_BUFFER_SIZE = 65536
+    # flow-control window of the shell channel, bulky output needs fewer window adjustments
+    CHANNEL_WINDOW_SIZE = 4 * 1024 * 1024
+    # longest a read loop blocks waiting for output before rechecking its timeout
+    RECV_POLL_TIMEOUT = 0.05
+    # longest wait for the remote reaction to a responder's answer
+    RESPONSE_TIMEOUT = 0.5
+
+    def __init__(
+            self,
+            hostname: str,
+            username: str,
+            password: str,
+            port: int = 22,
+            transport_provider: Optional[Callable[[], paramiko.Transport]] = None,
+            keepalive_interval: int = 30,
+        ) -> None:
+        """
+        Args:
+            transport_provider: Optional callable returning an already authenticated
+                transport to the host. When given, the shell is opened as a new channel
+                on that (shared) transport instead of over a dedicated SSH connection,
+                and `close` leaves the transport open for its owner.
+            keepalive_interval: Seconds between SSH keepalives on a connection opened
+                by this class (0 disables them), a shared transport keeps its own setting.
+        """
         self.hostname: str = hostname
         self.username: str = username
         self.password: str = password
         self.port: int = port
+        self.transport_provider = transport_provider
+        self.keepalive_interval = keepalive_interval
         self.client: Optional[paramiko.SSHClient] = None
         self.channel: Optional[paramiko.Channel] = None
+        # the shell output is one UTF-8 stream cut at arbitrary byte boundaries,
+        # the incremental decoder keeps a multi-byte char split between reads
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors= "replace")
 
     def connect(
             self,
             verbose: bool = False,
             connection_timeout: float = 60,
             shell_prompt_timeout: float = 60,
-            shell_prompt_pattern: str = DEFAULT_SHELL_PROMPT_PATTERN,    
+            shell_prompt_pattern: str | re.Pattern = DEFAULT_SHELL_PROMPT_RE,    
         ):
         """
         Establish an SSH connection and open an interactive shell session.
@@ -49,34 +122,44 @@ class SSHConnection:
             verbose (bool): If True, prints the output while waiting for the prompt.
             shell_promt_timeout (float): Maximum time (in seconds) to wait for the shell prompt.
             connection_timeout (float): Timeout (in seconds) for establishing the SSH connection.
-            shell_prompt_pattern (str): Regular expression pattern used to detect the shell prompt.
-                Can be customized to match different shells or environments.
+            shell_prompt_pattern (str | re.Pattern): Regular expression (pattern or precompiled) used to
+                detect the shell prompt. Can be customized to match different shells or environments.
 
         Raises:
             PromptTimeoutError: If the shell prompt is not detected within the timeout window.
         """
-        self.client = paramiko.SSHClient()
-        self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        self.client.connect(
-            hostname=self.hostname,
-            port=self.port,
-            username=self.username,
-            password=self.password,
-            allow_agent=False,
+        if self.transport_provider is not None:
+            transport = self.transport_provider()
+        else:
+            self.client = paramiko.SSHClient()
+            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            self.client.connect(
+                hostname=self.hostname,
+                port=self.port,
+                username=self.username,
+                password=self.password,
+                allow_agent=False,
+                timeout= connection_timeout,
+                # look_for_keys=False
+            )
+            transport = self.client.get_transport()
+            # keep the session alive through NAT/firewall idle timeouts
+            transport.set_keepalive(self.keepalive_interval) # type: ignore
+    
+        self.channel = transport.open_session( #type: ignore
+            window_size= self.CHANNEL_WINDOW_SIZE,
             timeout= connection_timeout,
-            # look_for_keys=False
         )
-    
-        self.channel = self.client.get_transport().open_session() #type: ignore
+        self._decoder.reset()
         self.channel.get_pty()
         self.channel.invoke_shell()
 
-        time.sleep(1)
+        # no warm-up sleep: expect returns as soon as the prompt shows up
         try:
             self.expect(shell_prompt_pattern, timeout= shell_prompt_timeout, hide= not verbose)
         except TimeoutError as e:
             raise PromptTimeoutError(
-                f"Timeout while waiting for shell prompt pattern '{shell_prompt_pattern}' after {shell_prompt_timeout}s."
+                f"Timeout while waiting for shell prompt pattern '{_as_regex(shell_prompt_pattern).pattern}' after {shell_prompt_timeout}s."
             ) from e
 
     def ensure_channel_ready(self) -> None:
@@ -105,10 +188,35 @@ class SSHConnection:
         self.ensure_channel_ready()
 
         if self.channel.recv_ready(): # type: ignore
-            return self.channel.recv(nbytes).decode("utf-8") # type: ignore
+            return self._decoder.decode(self.channel.recv(nbytes)) or None # type: ignore
         return None
 
-    def send(self, cmd: str, wait: float = 0.1) -> int:
+    def _recv(self, timeout: float) -> str | None:
+        """
+        Block up to *timeout* seconds for output and return it decoded, or None
+        if nothing arrived. Returns as soon as data is available.
+
+        Raises:
+            ChannelClosedError: If the channel was closed (by the remote end or
+                by closing its transport), no output can arrive anymore.
+        """
+        channel = self.channel
+        channel.settimeout(timeout) # type: ignore
+        try:
+            data = channel.recv(self.RECV_BUFFER_SIZE) # type: ignore
+        except socket.timeout:
+            return None
+        finally:
+            # back to blocking, so `send` keeps waiting for window space
+            channel.settimeout(None) # type: ignore
+
+        if not data:
+            # closed channel: recv returns at once forever, nothing else will come
+            raise ChannelClosedError("SSH channel closed while waiting for output.")
+
+        return self._decoder.decode(data) or None
+
+    def send(self, cmd: str, wait: float = 0) -> int:
         """
         Send a command string to the remote interactive shell.
 
@@ -117,7 +225,7 @@ class SSHConnection:
 
         Args:
             cmd: The command to send.
-            wait: Seconds to wait after sending.
+            wait: Seconds to wait after sending (none by default).
 
         Returns:
             Number of bytes sent.
@@ -128,11 +236,12 @@ class SSHConnection:
         self.ensure_channel_ready()
         
         out = self.channel.send(f"{cmd}\n".encode("utf-8")) # type: ignore
-        time.sleep(wait)
+        if wait:
+            time.sleep(wait)
 
         return out
 
-    def expect(self, pattern: str, timeout: float = 10.0, hide: bool = False) -> str:
+    def expect(self, pattern: str | re.Pattern, timeout: float = 10.0, hide: bool = False) -> str:
         """
         Waits for a given regex pattern to appear in the shell output.
 
@@ -140,7 +249,7 @@ class SSHConnection:
         or the timeout is reached. Optionally prints the received output in real-time.
 
         Args:
-            pattern: Regex pattern to search for.
+            pattern: Regex pattern (or precompiled regex) to search for.
             timeout: Max time to wait for pattern.
             hide: If True, suppresses live printing of output.
 
@@ -153,12 +262,12 @@ class SSHConnection:
         """
         self.ensure_channel_ready()
         
-        regex = re.compile(pattern)
+        regex = _as_regex(pattern)
         output: str = ""
         start_time = time.time()
         while time.time() - start_time < timeout:
-            if self.channel.recv_ready(): # type: ignore
-                chunk = self.channel.recv(self.RECV_BUFFER_SIZE).decode("utf-8") # type: ignore
+            chunk = self._recv(self.RECV_POLL_TIMEOUT)
+            if chunk:
                 output += chunk
 
                 if not hide:
@@ -166,14 +275,12 @@ class SSHConnection:
                 
                 if regex.search(output):
                     return output
-                
-            time.sleep(0.1)
 
-        raise TimeoutError(f"Timeout waiting for prompt: {pattern} \n output: {output}")
+        raise TimeoutError(f"Timeout waiting for prompt: {regex.pattern} \n output: {output}")
 
     def close(self) -> None:
         """
-        Close the SSH channel and client.
+        Close the SSH channel and client (a shared transport is left open).
         """
         if self.channel:
             self.channel.close()
@@ -219,17 +326,24 @@ class SSHConnection:
         self.ensure_channel_ready()
         
         responders = responders or []
-        break_on_pattern = re.compile(break_on) if break_on else None
-        exitcode_pattern = re.compile(rf"{exitcode_delimiter}:(\d+)")
+        # one scan per read tells whether any responder has to be checked
+        any_responder_pattern = _any_of_regex([r.pattern for r in responders]) if responders else None
+        break_on_pattern = _as_regex(break_on) if break_on else None
+        exitcode_pattern = CommandFormatter.exit_code_regex(exitcode_delimiter)
         full_output = ""
         exit_code: int = InternalExitCode.UNSET
         
-        bytes_sent = self.send(formatted_command, wait=0)
+        bytes_sent = self.send(formatted_command)
         out = self.flush(bytes_sent)
         if out and not hide:        
             print(out, end="")
 
-        output_chunks: list[str] = [""]
+        output_chunks: list[str] = []
+        output = "" # last chunk, the one being received and scanned
+        # searches resume from scan_pos instead of rescanning the whole output,
+        # responders also skip what they already answered
+        scan_pos = 0
+        responded_pos = 0
         start_time = time.time()
 
         while True:
@@ -240,33 +354,47 @@ class SSHConnection:
                    f"break_on: {break_on}"
                 )
 
-            if self.channel.recv_ready(): # type: ignore
-                chunk = self.channel.recv(self.RECV_BUFFER_SIZE).decode("utf-8") # type: ignore
-                output_chunks[-1] += chunk
+            chunk = self._recv(self.RECV_POLL_TIMEOUT)
+            if chunk:
+                output += chunk
                 if not hide:
                     print(chunk, end="")
 
-            for responder in responders:
-                if responder._compiled_regex.search(output_chunks[-1]):
-                    self.send(responder.response, wait=0.5)
+            respond_from = max(scan_pos, responded_pos)
+            if any_responder_pattern is not None and not any_responder_pattern.search(output, respond_from):
+                pending_responders = ()
+            else:
+                pending_responders = responders
+
+            for responder in pending_responders:
+                if responder._compiled_regex.search(output, respond_from):
+                    self.send(responder.response)
                     if not hide:
                         print("RESPONSE:", repr(responder.response))
-                    out = self.flush()
+                    responded_pos = len(output)
+                    # whatever arrives first, the rest is read by the loop
+                    out = self._recv(self.RESPONSE_TIMEOUT)
                     if out:
-                        output_chunks.append(out)
+                        output_chunks.append(output)
+                        output = out
+                        scan_pos = responded_pos = respond_from = 0
                         if not hide:                            
                             print(out, end="")
 
-            if exitcode_pattern.search(output_chunks[-1]):
+            # plain substring lookup first, the regex only confirms the digits
+            marker_pos = output.find(exitcode_delimiter, scan_pos)
+            if marker_pos != -1 and exitcode_pattern.search(output, marker_pos):
                 break
 
-            if break_on_pattern and break_on_pattern.search(output_chunks[-1]):
+            if break_on_pattern and break_on_pattern.search(output, scan_pos):
                 if not hide:
                     print("BREAK FOUND")
                 exit_code = InternalExitCode.BREAK_TRIGGERED
                 break
 
-            time.sleep(0.1)
+            scan_pos = _rescan_start(output)
+
+        output_chunks.append(output)
 
         # Final flush (just to make sure nothing is there)
         out = self.flush()
@@ -4,6 +4,13 @@ class PromptTimeoutError(TimeoutError):
 class CommandTimeoutError(TimeoutError):
     pass
 
+class ChannelClosedError(CommandTimeoutError):
+    """
+    Raised when the channel closes while waiting for output: the output can no
+    longer arrive, so the wait fails right away, handled like a timeout.
+    """
+    pass
+
 class GatewaySSHConnectionError(Exception):
     pass
 
@@ -1,9 +1,16 @@
 import re
 import shlex
+from functools import lru_cache
 from pathlib import Path
 from .exceptions import ExitCodeNotFoundError
 
 
+@lru_cache(maxsize=32)
+def _exitcode_regex(exitcode_delimiter: str) -> re.Pattern:
+    # the delimiter is echoed literally, so it must not be read as a regex
+    return re.compile(rf"{re.escape(exitcode_delimiter)}:(\d+)")
+
+
 class CommandFormatter:
     """
     Provides utility methods to format shell commands consistently,
@@ -97,6 +104,14 @@ class CommandFormatter:
 
         return CommandFormatter.bash_script_from_string(script_content, exitcode_delimiter, args, run_as_root,)       
 
+    @staticmethod
+    def exit_code_regex(exitcode_delimiter: str) -> re.Pattern:
+        """
+        Returns the compiled regex matching the `<exitcode_delimiter>:<code>` marker,
+        compiled once per delimiter.
+        """
+        return _exitcode_regex(exitcode_delimiter)
+
     @staticmethod
     def extract_exit_code(output: str, exitcode_delimiter: str) -> tuple[int, str]:
         """
@@ -112,7 +127,7 @@ class CommandFormatter:
         Raises:
             ExitCodeNotFoundError: If the delimiter is not found in the output.
         """
-        match = re.search(rf"{exitcode_delimiter}:(\d+)", output)
+        match = _exitcode_regex(exitcode_delimiter).search(output)
         if not match:
             raise ExitCodeNotFoundError()
         
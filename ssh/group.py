@@ -1,3 +1,5 @@
+from typing import Callable
+from paramiko import Transport
 from pydantic import SecretStr
 
 from .base import SSHConnectionData
@@ -39,6 +41,7 @@ class SerialRecursiveSSHGroup:
             shell_target_prompt_pattern: str,
             connection_timeout: float = 60,
             shell_prompt_timeout: float = 90,
+            gateway_transport_provider: Callable[[], Transport] | None = None,
         ):
         """
         Initialize the group with gateway and target SSH configuration.
@@ -50,6 +53,8 @@ class SerialRecursiveSSHGroup:
             shell_target_prompt_pattern: Regex to detect the shell prompt on the target.
             connection_timeout: Timeout for SSH connections (in seconds).
             shell_prompt_timeout: Timeout to wait for shell prompts (in seconds).
+            gateway_transport_provider: Optional callable returning an authenticated transport
+                to the gateway, shared with other groups/copies instead of a new SSH connection.
 
         Raises:
             ValueError: If the target list is empty.
@@ -72,7 +77,8 @@ class SerialRecursiveSSHGroup:
         )
         self.session = RecursiveSSHSession(
             gateway_data= gateway_data,
-            target_data= self._dummy_target
+            target_data= self._dummy_target,
+            gateway_transport_provider= gateway_transport_provider,
         )
 
     def __enter__(self):
@@ -0,0 +1,95 @@
+import threading
+from fabric import Connection
+
+
+class SSHConnectionPool:
+    """
+    Keeps authenticated Fabric connections open, keyed by (host, user), so
+    consecutive operations against the same machine share a single SSH
+    handshake instead of reconnecting every time.
+
+    Connections are opened lazily on the first `get` and validated on every
+    later one: a dropped or unauthenticated transport is closed and replaced.
+    The pool can be shared between threads. Call `close_all` (or use the pool
+    as a context manager) when done.
+    """
+
+    def __init__(self, keepalive_interval: int = 30, banner_timeout: float = 30) -> None:
+        """
+        Args:
+            keepalive_interval (int): Seconds between SSH keepalive packets sent
+                on every pooled transport. Use 0 to disable them.
+            banner_timeout (float): Seconds to wait for the SSH banner when connecting.
+        """
+        self.keepalive_interval = keepalive_interval
+        self.banner_timeout = banner_timeout
+        self._connections: dict[tuple[str, str], Connection] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close_all()
+
+    @staticmethod
+    def _is_alive(conn: Connection) -> bool:
+        transport = conn.transport
+        return (
+            transport is not None
+            and transport.is_active()
+            and transport.is_authenticated()
+        )
+
+    def get(
+            self,
+            host: str,
+            user: str,
+            password: str,
+            connect_timeout: float | None = None,
+        ) -> Connection:
+        """
+        Return an open connection to `user@host`, creating it if needed.
+
+        Args:
+            connect_timeout (float | None): Seconds to wait for the TCP connection
+                when a new connection has to be opened (None waits for the OS timeout).
+
+        Raises:
+            Whatever Paramiko/Fabric raise while connecting (socket errors,
+            `AuthenticationException`, `SSHException`, ...).
+        """
+        key = (host, user)
+        with self._lock:
+            conn = self._connections.get(key)
+            if conn is not None and self._is_alive(conn):
+                return conn
+
+            if conn is not None:
+                # stale: drop it and start from zero
+                conn.close()
+
+            conn = Connection(
+                f"{user}@{host}",
+                connect_timeout= connect_timeout,
+                connect_kwargs={
+                    "password": password,
+                    "banner_timeout": self.banner_timeout,
+                    # password only, like the dedicated paramiko connections:
+                    # no agent or local keys tried first
+                    "allow_agent": False,
+                    "look_for_keys": False,
+                },
+            )
+            self._connections[key] = conn
+            conn.open()
+            conn.transport.set_keepalive(self.keepalive_interval) # type: ignore
+
+            return conn
+
+    def close_all(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
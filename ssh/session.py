@@ -1,3 +1,6 @@
+from typing import Callable
+from paramiko import Transport
+
 from .base import (
     SSHConnectionData,
     InternalExitCode,
@@ -35,7 +38,12 @@ class RecursiveSSHSession:
     GATEWAY_SESSION_VAR = "__GATEWAY_SESSION"
     SESSION_VAR_VALUE = "__OK__"
 
-    def __init__(self, gateway_data: SSHConnectionData, target_data: SSHConnectionData) -> None:
+    def __init__(
+            self,
+            gateway_data: SSHConnectionData,
+            target_data: SSHConnectionData,
+            gateway_transport_provider: Callable[[], Transport] | None = None,
+        ) -> None:
         """
         Initializes the RecursiveSSHSession with credentials for the gateway and destination hosts.
 
@@ -44,12 +52,16 @@ class RecursiveSSHSession:
                 Connection data for the intermediate (gateway) machine.
             destination_data: SSHConnectionData
                 Connection data for the target (final) machine.
+            gateway_transport_provider: Callable | None
+                Optional callable returning an authenticated transport to the gateway,
+                the gateway shell is then opened on it instead of a new SSH connection.
         """        
         self.gateway = SSHConnection(
             hostname= gateway_data.host,
             username= gateway_data.user,
             password= gateway_data.password.get_secret_value(),
-            port= gateway_data.port
+            port= gateway_data.port,
+            transport_provider= gateway_transport_provider,
         )
         self.target_data = target_data
 
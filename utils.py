@@ -3,6 +3,7 @@ import fnmatch
 import hashlib
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from cryptography.fernet import Fernet
 from typing import Iterable
@@ -16,21 +17,70 @@ logger = logging.getLogger(__name__)
 
 def load_json_file(filepath: str) -> dict:
     """Loads a JSON file and returns its contents as a dictionary."""
-    text = Path(filepath).read_text(encoding="utf-8")
+    # one unbuffered read of the whole file, parsed straight from the UTF-8
+    # bytes: no buffer layer or intermediate str for these small files
+    with open(filepath, "rb", buffering= 0) as f:
+        return json.loads(f.readall())
 
-    return json.loads(text)
+def write_text_file_atomic(filepath: str, text: str) -> str:
+    """
+    Writes text to a file atomically: the content goes to a temporary file in
+    the same directory which then replaces *filepath*, so readers never see a
+    half-written file.
+
+    Args:
+        filepath (str): Path to the output file.
+        text (str): Content to write (UTF-8).
 
-def write_json_file(filepath: str, data: dict, indent: int | None = 4) -> None:
+    Returns:
+        str: SHA-256 hex digest of the written bytes, so callers need not read
+            the file back to checksum it.
     """
-    Writes a dictionary to a JSON file.
+    return write_bytes_file_atomic(filepath, text.encode("utf-8"))
+
+def write_bytes_file_atomic(filepath: str, data: bytes) -> str:
+    """
+    Same as `write_text_file_atomic` for already encoded UTF-8 text.
+
+    Returns:
+        str: SHA-256 hex digest of the written bytes.
+    """
+    if os.linesep != "\n":
+        # same newline translation a text-mode file would do
+        data = data.replace(b"\n", os.linesep.encode())
+
+    tmp_filepath = f"{filepath}.tmp"
+    try:
+        with open(tmp_filepath, "wb") as f:
+            f.write(data)
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        if os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+        raise
+
+    return hashlib.sha256(data).hexdigest()
+
+def write_json_file(filepath: str, data: dict, indent: int | None = 4) -> str:
+    """
+    Writes a dictionary to a JSON file (atomically, see `write_text_file_atomic`).
 
     Args:
         filepath (str): Path to the output JSON file.
         data (dict): Dictionary to serialize.
         indent (int | None): Indentation level for pretty-printing. Use None for compact output.
+
+    Returns:
+        str: SHA-256 hex digest of the written file.
     """
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii= False, indent= indent)
+    if indent is None:
+        return write_text_file_atomic(filepath, json.dumps(data, ensure_ascii= False))
+
+    # the stdlib C encoder does not indent, pydantic-core's Rust serializer
+    # gives the same output as json.dumps several times faster, already as bytes
+    from pydantic_core import to_json
+
+    return write_bytes_file_atomic(filepath, to_json(data, indent= indent))
 
 def prettify_json(data: dict, indent: int | None = 4) -> str:
     """
@@ -167,9 +217,18 @@ def file_sha256sum(filepath: str) -> str:
 
     return digest.hexdigest()
 
+def _files_sha256sums(filepaths: list[str]) -> list[str]:
+    """SHA-256 checksums of `filepaths`, in order, hashed in parallel threads (OpenSSL releases the GIL)."""
+    if len(filepaths) < 2:
+        return [file_sha256sum(path) for path in filepaths]
+
+    with ThreadPoolExecutor(max_workers= min(len(filepaths), os.cpu_count() or 1)) as executor:
+        return list(executor.map(file_sha256sum, filepaths))
+
 def generate_sha256_checksum_file(
         file_list: list[str],
         output_file: str,
+        known_checksums: dict[str, str] | None = None,
     ) -> None:
     """
     Generates a SHA-256 checksum file for a list of files.
@@ -179,6 +238,9 @@ def generate_sha256_checksum_file(
     Args:
         file_list (list[str]): List of file paths to hash.
         output_file (str): Path to the checksum output file.
+        known_checksums (dict[str, str] | None): filepath → hex digest of files
+            whose checksum is already known (e.g. returned by `write_json_file`),
+            those are not read again.
 
     Notes:
         Invalid or non-existent files will be skipped with a warning.
@@ -187,14 +249,22 @@ def generate_sha256_checksum_file(
         logger.warning("No files to hash. SHA256 Checksum file will not be created.")
         return
 
+    valid_files = []
+    for filename in file_list:
+        if os.path.isfile(filename):
+            valid_files.append(filename)
+        else:
+            logger.warning(f"'{filename}' is not a valid file and will be skipped.")
+
+    known_checksums = known_checksums or {}
+    to_hash = [filename for filename in valid_files if filename not in known_checksums]
+    computed = dict(zip(to_hash, _files_sha256sums(to_hash)))
+    hashes = [known_checksums.get(filename) or computed[filename] for filename in valid_files]
+
     with open(output_file, 'w') as out:
-        for filename in file_list:
-            if os.path.isfile(filename):
-                hash_val = file_sha256sum(filename)
-                # Format: <hash><space><space><filepath>
-                out.write(f"{hash_val}  {filename}\n")
-            else:
-                logger.warning(f"'{filename}' is not a valid file and will be skipped.")
+        for filename, hash_val in zip(valid_files, hashes):
+            # Format: <hash><space><space><filepath>
+            out.write(f"{hash_val}  {filename}\n")
 
 def checksum_verfication_sha256(checksum_file: str) -> bool:
     """
@@ -212,6 +282,7 @@ def checksum_verfication_sha256(checksum_file: str) -> bool:
     
     all_valid = True
     mismatch_cnt = 0
+    entries: list[tuple[str, str]] = []
     
     with open(checksum_file, "r", encoding="utf-8") as f:
         for cnt, line in enumerate(f, start=1):
@@ -226,13 +297,17 @@ def checksum_verfication_sha256(checksum_file: str) -> bool:
                 all_valid = False
                 continue
 
-            actual_hash = file_sha256sum(filepath)
-            if actual_hash != expected_hash:
-                log_info(f"{filepath}: FAILED", logger)
-                all_valid = False
-                mismatch_cnt += 1
-            else:
-                log_info(f"{filepath}: OK", logger)
+            entries.append((expected_hash, filepath))
+
+    actual_hashes = _files_sha256sums([filepath for _, filepath in entries])
+
+    for (expected_hash, filepath), actual_hash in zip(entries, actual_hashes):
+        if actual_hash != expected_hash:
+            log_info(f"{filepath}: FAILED", logger)
+            all_valid = False
+            mismatch_cnt += 1
+        else:
+            log_info(f"{filepath}: OK", logger)
 
     if mismatch_cnt > 0:
         log_warning(